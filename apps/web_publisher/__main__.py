@@ -2,4 +2,6 @@
 import sys
 from .cli import main
 
-sys.exit(main() or 0)
+# spawn 방식 multiprocessing 워커가 이 모듈을 다시 import해도 CLI가 재실행되지 않도록 가드
+if __name__ == "__main__":
+    sys.exit(main() or 0)
@@ -11,19 +11,21 @@ Performance optimizations applied (Team 3):
   This is intentional and correct behavior for parallel browser sessions.
 - asyncio.gather + Semaphore pattern already correctly limits concurrency
   without creating unnecessary OS threads.
+- Blocking pipeline steps (PDF analysis / OCR, file copy, Firestore write) run
+  via asyncio.to_thread inside WebPublishPipeline.run, so one worker's I/O no
+  longer stalls the shared event loop. No process/thread pool per batch.
+- Firestore registration is deferred: workers return their article documents
+  and run() commits them together via WriteBatch (ceil(N/500) RPCs, not N).
 """
 import asyncio
-import sys
 from typing import List, Dict, Any
 
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
-
 from noterang.config import NoterangConfig, get_config
 from noterang.auth import ensure_auth
 
 from .config import WebPublisherConfig
 from .pipeline import WebPublishPipeline
+from .firestore_client import FirestoreClient
 
 
 class BatchPublisher:
@@ -79,11 +81,27 @@ class BatchPublisher:
             else:
                 final.append(r)
 
+        # 파이프라인이 보류한 자료실 문서를 한 번에 등록
+        if self.register:
+            self._register_pending(final)
+
         # 결과 요약
         success_count = sum(1 for r in final if r.get("success"))
         print(f"\n배치 완료: {success_count}/{len(self.titles)} 성공")
         return final
 
+    def _register_pending(self, results: List[Dict[str, Any]]) -> None:
+        """워커 결과의 "article" 문서들을 WriteBatch로 일괄 등록하고 doc_id 채움"""
+        pending = [r for r in results if r.get("article")]
+        if not pending:
+            return
+
+        print(f"\n자료실 일괄 등록: {len(pending)}건")
+        client = FirestoreClient(self.publisher_config.firebase_project_id)
+        doc_ids = client.register_articles_bulk([r.pop("article") for r in pending])
+        for result, doc_id in zip(pending, doc_ids):
+            result["doc_id"] = doc_id
+
     async def _run_worker(
         self,
         worker_id: int,
@@ -108,6 +126,7 @@ class BatchPublisher:
                 slide_count=self.slide_count,
                 noterang_config=config,
                 publisher_config=self.publisher_config,
+                defer_register=True,
             )
 
             result = await pipeline.run()
@@ -13,21 +13,22 @@ import argparse
 import asyncio
 import json
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
-
-# noterang 패키지 경로
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+logger = logging.getLogger(__name__)
 
-from .config import WebPublisherConfig
-from .pipeline import WebPublishPipeline
-from .batch import BatchPublisher
+# RESULT: 출력 직렬화 — orjson(C 확장)이 있으면 사용, 없으면 표준 json
+try:
+    import orjson
 
-logger = logging.getLogger(__name__)
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -58,8 +59,21 @@ def find_latest_pdf(directory: Path = DOWNLOAD_DIR) -> Optional[Path]:
     if not directory.exists():
         logger.warning("Download directory does not exist: %s", directory)
         return None
-    pdfs = sorted(directory.glob("*.pdf"), key=lambda p: p.stat().st_mtime, reverse=True)
-    return pdfs[0] if pdfs else None
+
+    # 단일 scandir 패스 + 최댓값 추적 (정렬 없음, DirEntry.stat() 캐시 활용)
+    best_path: Optional[str] = None
+    best_mtime = -1.0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.lower().endswith(".pdf"):
+                continue
+            if not entry.is_file():
+                continue
+            mtime = entry.stat().st_mtime
+            if mtime > best_mtime:
+                best_mtime = mtime
+                best_path = entry.path
+    return Path(best_path) if best_path else None
 
 
 def add_common_args(parser: argparse.ArgumentParser) -> None:
@@ -104,6 +118,8 @@ async def cmd_single(args: argparse.Namespace) -> int:
     Returns:
         Exit code: ``0`` on success, ``1`` on failure.
     """
+    from .pipeline import WebPublishPipeline
+
     queries = args.queries.split(",") if args.queries else None
 
     pipeline = WebPublishPipeline(
@@ -117,7 +133,7 @@ async def cmd_single(args: argparse.Namespace) -> int:
     )
 
     result = await pipeline.run()
-    print(f"\nRESULT:{json.dumps(result, ensure_ascii=False)}")
+    print(f"\nRESULT:{_dumps(result)}")
     return 0 if result.get("success") else 1
 
 
@@ -137,6 +153,8 @@ async def cmd_batch(args: argparse.Namespace) -> int:
         print("오류: --titles에 최소 1개 주제를 입력하세요.")
         return 1
 
+    from .batch import BatchPublisher
+
     batch = BatchPublisher(
         titles=titles,
         design=args.design,
@@ -149,7 +167,7 @@ async def cmd_batch(args: argparse.Namespace) -> int:
 
     results = await batch.run()
     success_count = sum(1 for r in results if r.get("success"))
-    print(f"\nRESULT:{json.dumps(results, ensure_ascii=False)}")
+    print(f"\nRESULT:{_dumps(results)}")
     return 0 if success_count == len(titles) else 1
 
 
@@ -178,6 +196,8 @@ async def cmd_pdf(args: argparse.Namespace) -> int:
         print("오류: --pdf 또는 --latest 중 하나를 지정하세요.")
         return 1
 
+    from .pipeline import WebPublishPipeline
+
     pipeline = WebPublishPipeline(
         title=args.title,
         pdf_path=pdf_path,
@@ -188,10 +208,19 @@ async def cmd_pdf(args: argparse.Namespace) -> int:
     )
 
     result = await pipeline.run()
-    print(f"\nRESULT:{json.dumps(result, ensure_ascii=False)}")
+    print(f"\nRESULT:{_dumps(result)}")
     return 0 if result.get("success") else 1
 
 
+# 파이프라인 모듈(noterang, firebase_admin, fitz 등)은 각 핸들러 안에서
+# 지연 import — --help / 인자 오류 경로에서는 로드되지 않음
+_COMMANDS = {
+    "single": cmd_single,
+    "batch": cmd_batch,
+    "pdf": cmd_pdf,
+}
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
@@ -203,6 +232,14 @@ def main() -> int:
     Returns:
         Exit code: ``0`` on success, ``1`` on failure or missing command.
     """
+    # Windows 콘솔 한글 출력 — 호출자가 PYTHONIOENCODING으로 인코딩을
+    # 지정했다면 그대로 존중 (import 시점 부작용 없음)
+    if sys.platform == 'win32' and not os.environ.get('PYTHONIOENCODING'):
+        try:
+            sys.stdout.reconfigure(encoding='utf-8')
+        except (AttributeError, ValueError):
+            pass
+
     parser = argparse.ArgumentParser(
         description="web_publisher: NotebookLM PDF → 웹 자료실 등록"
     )
@@ -245,11 +282,7 @@ def main() -> int:
         parser.print_help()
         return 1
 
-    if args.command == "single":
-        return asyncio.run(cmd_single(args))
-    if args.command == "batch":
-        return asyncio.run(cmd_batch(args))
-    if args.command == "pdf":
-        return asyncio.run(cmd_pdf(args))
-
-    return 1
+    handler = _COMMANDS.get(args.command)
+    if handler is None:
+        return 1
+    return asyncio.run(handler(args))
@@ -5,29 +5,43 @@ WebPublisher 설정
 """
 import logging
 import os
-import sys
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
-
 logger = logging.getLogger(__name__)
 
-# .env.local 로드
-try:
-    from dotenv import load_dotenv
-    for env_path in [
-        Path(__file__).parent / '.env.local',
-        Path("D:/Projects/notebooklm-automation/.env.local"),
-    ]:
+# .env.local 후보 경로 (앞쪽 우선)
+_ENV_LOCAL_CANDIDATES = (
+    Path(__file__).parent / '.env.local',
+    Path("D:/Projects/notebooklm-automation/.env.local"),
+)
+
+# 한 번 로드하면 설정되는 환경 변수 — 자식 프로세스도 상속받아 재탐색 생략
+_ENV_LOADED_FLAG = '_WEBPUB_ENV_LOADED'
+
+
+@lru_cache(maxsize=1)
+def _find_env_local() -> Optional[Path]:
+    """존재하는 첫 번째 .env.local 경로 (프로세스당 1회 탐색)"""
+    for env_path in _ENV_LOCAL_CANDIDATES:
         if env_path.exists():
+            return env_path
+    return None
+
+
+# .env.local 로드
+if not os.environ.get(_ENV_LOADED_FLAG):
+    try:
+        from dotenv import load_dotenv
+        env_path = _find_env_local()
+        if env_path is not None:
             load_dotenv(env_path)
             logger.debug("Loaded environment variables from %s", env_path)
-            break
-except ImportError:
-    pass
+        os.environ[_ENV_LOADED_FLAG] = '1'
+    except ImportError:
+        pass
 
 # ---------------------------------------------------------------------------
 # Constants
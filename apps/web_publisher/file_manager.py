@@ -1,19 +1,20 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-파일 관리 - UUID 파일명 + uploads 복사
+파일 관리 - 고유 파일명 + uploads 복사
 """
+import errno
+import itertools
 import logging
+import os
+import secrets
 import shutil
-import sys
-import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple
 
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
-
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -21,16 +22,63 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 _TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
-_UUID_LENGTH = 8
 _FILE_PREFIX = "noterang"
 
+# 파일명에 쓸 수 없는/경로를 바꾸는 문자 치환표 (한 번의 C 레벨 패스)
+_TITLE_TRANSLATE = str.maketrans({" ": "_", "/": "-", "\\": "-", ":": "-"})
+
+# 파일명 고유 ID = 프로세스별 1회 난수 + 단조 증가 카운터 (호출마다 RNG 불필요)
+_PROCESS_NONCE = secrets.token_hex(4)
+_NAME_COUNTER = itertools.count()
+_NAME_LOCK = threading.Lock()
+
+# PDF 복사를 썸네일 쓰기와 겹쳐 실행하기 위한 공유 워커
+_COPY_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="file-copy")
+
+
+def _copy_new_file(src: Path, dest: Path) -> None:
+    """Copy *src* to *dest* with :func:`shutil.copy2`, refusing to overwrite.
+
+    ``copy2`` keeps the platform fast path (``sendfile`` etc.) and the file
+    metadata. An existing *dest* raises :class:`FileExistsError` up front
+    instead of being replaced.
+
+    Args:
+        src: Source file path.
+        dest: Destination file path; must not exist yet.
+    """
+    if dest.exists():
+        raise FileExistsError(errno.EEXIST, "File exists", str(dest))
+    shutil.copy2(src, dest)
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    """Hard-link *src* to *dest*, falling back to :func:`_copy_new_file`.
+
+    A hard link costs a single metadata operation instead of copying the
+    whole PDF. It fails across volumes (e.g. ``G:`` Drive mount → ``D:``
+    web app) or on file systems without link support, in which case the
+    file is copied instead. An existing *dest* is never overwritten.
+
+    Args:
+        src: Source file path.
+        dest: Destination file path; must not exist yet.
+    """
+    try:
+        os.link(src, dest)
+    except FileExistsError:
+        raise
+    except OSError as e:
+        logger.debug("Hard link failed (%s) - copying %s instead", e, src)
+        _copy_new_file(src, dest)
+
 
 class FileManager:
     """Copy PDF files and thumbnails into the web application uploads directory.
 
-    Each file is given a unique name composed of a timestamp, a short UUID
-    fragment, and a sanitised version of the article title to avoid collisions
-    and make names human-readable.
+    Each file is given a unique name composed of a timestamp, a process-unique
+    nonce plus counter, and a sanitised version of the article title to avoid
+    collisions and make names human-readable.
 
     Attributes:
         uploads_dir: Target directory for uploaded files.
@@ -70,21 +118,35 @@ class FileManager:
             *thumb_url* is ``None`` when no thumbnail was provided.
         """
         timestamp = datetime.now().strftime(_TIMESTAMP_FORMAT)
-        unique_id = uuid.uuid4().hex[:_UUID_LENGTH]
-        safe_title = title.replace(" ", "_").replace("/", "-")
+        with _NAME_LOCK:
+            unique_id = f"{_PROCESS_NONCE}{next(_NAME_COUNTER):04x}"
+        safe_title = title.translate(_TITLE_TRANSLATE)
 
         pdf_name = f"{_FILE_PREFIX}_{timestamp}_{unique_id}_{safe_title}.pdf"
         pdf_dest = self.uploads_dir / pdf_name
-        shutil.copy2(str(pdf_path), str(pdf_dest))
         pdf_url = f"/uploads/{pdf_name}"
-        logger.info("PDF copied to %s", pdf_dest)
 
         thumb_url: Optional[str] = None
         if thumbnail:
             thumb_name = f"{_FILE_PREFIX}_{timestamp}_{unique_id}_{safe_title}_thumb.png"
             thumb_dest = self.uploads_dir / thumb_name
-            thumb_dest.write_bytes(thumbnail)
+            # PDF 복사와 썸네일 쓰기는 서로 다른 파일 — 동시에 수행해
+            # 소요시간을 합이 아닌 max(pdf, thumb)로 줄임
+            pdf_future = _COPY_EXECUTOR.submit(_link_or_copy, pdf_path, pdf_dest)
+            try:
+                with open(thumb_dest, "xb") as f:
+                    f.write(thumbnail)
+            except BaseException:
+                # 썸네일 실패 시에도 PDF 복사가 끝날 때까지 기다리고 그 오류도 기록
+                pdf_error = pdf_future.exception()
+                if pdf_error is not None:
+                    logger.error("PDF copy to %s also failed", pdf_dest, exc_info=pdf_error)
+                raise
+            pdf_future.result()
             thumb_url = f"/uploads/{thumb_name}"
             logger.info("Thumbnail saved to %s", thumb_dest)
+        else:
+            _link_or_copy(pdf_path, pdf_dest)
+        logger.info("PDF copied to %s", pdf_dest)
 
         return pdf_url, thumb_url
@@ -4,41 +4,114 @@
 Firestore 자료실 등록 클라이언트
 """
 import logging
-import sys
 import time
-from pathlib import Path
 from typing import Optional, List, Dict, Any
 
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
-
 logger = logging.getLogger(__name__)
 
 # 재시도 대상 예외 목록 (Google API 일시적 오류)
 _RETRYABLE_GOOGLE_ERRORS: tuple = ()
-try:
-    from google.api_core.exceptions import (
-        ServiceUnavailable,
-        InternalServerError,
-        DeadlineExceeded,
-    )
+# (예외 클래스, 로그 라벨, 사용자 메시지) — _handle_firestore_error가 isinstance로 분기
+_FIRESTORE_ERROR_DISPATCH: tuple = ()
+# 위 목록에 없는 Google API 오류 공통 기반 클래스
+_GOOGLE_API_ERRORS: tuple = ()
+# 위 세 목록은 _load_google_errors()가 첫 Firestore 사용 시 채운다
+_google_errors_loaded = False
+
+
+def _load_google_errors() -> None:
+    """google.api_core 예외 목록을 1회 import해 모듈 전역에 채움
+
+    google.api_core import(수십 ms)는 Firestore를 실제로 쓸 때만 치르도록
+    모듈 import 시점에서 첫 사용 시점으로 미룬다.
+    """
+    global _google_errors_loaded, _RETRYABLE_GOOGLE_ERRORS
+    global _FIRESTORE_ERROR_DISPATCH, _GOOGLE_API_ERRORS
+    if _google_errors_loaded:
+        return
+    _google_errors_loaded = True
+    try:
+        from google.api_core.exceptions import (
+            ServiceUnavailable,
+            InternalServerError,
+            DeadlineExceeded,
+            GoogleAPIError,
+            NotFound,
+            PermissionDenied,
+            ResourceExhausted,
+            Unauthenticated,
+        )
+    except ImportError:
+        return  # google-api-core 없으면 일반 Exception으로 폴백
+
     _RETRYABLE_GOOGLE_ERRORS = (ServiceUnavailable, InternalServerError, DeadlineExceeded)
-except ImportError:
-    pass  # google-api-core 없으면 일반 Exception으로 폴백
+    _FIRESTORE_ERROR_DISPATCH = (
+        (NotFound, "NotFound",
+         "컬렉션/문서를 찾을 수 없습니다 (NotFound). 프로젝트 ID '{project}' 를 확인하세요."),
+        (PermissionDenied, "PermissionDenied",
+         "권한 없음 (PermissionDenied). 서비스 계정 권한 또는 Firestore 보안 규칙을 확인하세요."),
+        (DeadlineExceeded, "DeadlineExceeded",
+         "요청 타임아웃. 네트워크 연결을 확인하세요."),
+        (Unauthenticated, "Unauthenticated",
+         "인증 실패. GOOGLE_APPLICATION_CREDENTIALS 를 확인하세요."),
+        (ResourceExhausted, "ResourceExhausted",
+         "할당량 초과 (ResourceExhausted). 잠시 후 재시도하세요."),
+        (ServiceUnavailable, "ServiceUnavailable",
+         "서비스 일시 중단 (ServiceUnavailable). 잠시 후 재시도하세요."),
+    )
+    _GOOGLE_API_ERRORS = (GoogleAPIError,)
+
+# 자료실 문서 컬렉션. doc_data 필드 키는 dict 리터럴의 코드 상수라
+# 이미 인터닝되어 호출마다 새로 할당되지 않으므로 그대로 둔다.
+_ARTICLES_COLLECTION = 'articles'
+
+# project_id → Firestore 클라이언트 (여러 FirestoreClient 인스턴스가 공유)
+_DB_CACHE: Dict[str, Any] = {}
+
+# 본문 전체 텍스트 최대 크기 (UTF-8 바이트)
+_CONTENT_MAX_BYTES = 24000
+
+# WriteBatch 1회 커밋당 최대 쓰기 수 (Firestore 제한)
+_MAX_BATCH_WRITES = 500
+
+# firebase_admin 모듈 캐시 — 무거운 import는 첫 사용 시 1회만 수행
+_firebase_admin = None
+_fs_admin = None
+
+
+def _load_firebase():
+    """firebase_admin과 firebase_admin.firestore를 1회 import 후 캐시해 반환
+
+    Raises:
+        ImportError: firebase-admin 패키지가 설치되지 않은 경우
+    """
+    global _firebase_admin, _fs_admin
+    if _fs_admin is None:
+        import firebase_admin
+        from firebase_admin import firestore as fs_admin
+        _firebase_admin, _fs_admin = firebase_admin, fs_admin
+    return _firebase_admin, _fs_admin
 
 
 def _retry_sync(func, max_attempts: int = 3, delay: float = 2.0, backoff: float = 2.0):
-    """동기 함수 재시도 (지수 백오프)"""
+    """동기 함수 재시도 (지수 백오프)
+
+    파이프라인은 이 함수를 asyncio.to_thread 워커에서 호출하므로 time.sleep
+    대기가 이벤트 루프(다른 배치 워커)를 막지 않는다.
+    """
+    _load_google_errors()
+    retryable = _RETRYABLE_GOOGLE_ERRORS
+    last_attempt = max_attempts - 1
     for attempt in range(max_attempts):
         try:
             return func()
-        except _RETRYABLE_GOOGLE_ERRORS as e:
-            if attempt == max_attempts - 1:
+        except retryable as e:
+            if attempt == last_attempt:
                 raise
             wait = delay * (backoff ** attempt)
             logger.warning(
-                f"Firestore retry {attempt + 1}/{max_attempts}: {e}. "
-                f"Waiting {wait:.1f}s..."
+                "Firestore retry %d/%d: %s. Waiting %.1fs...",
+                attempt + 1, max_attempts, e, wait,
             )
             time.sleep(wait)
 
@@ -51,12 +124,17 @@ class FirestoreClient:
         self._db = None
 
     def _get_db(self):
-        """Firestore 클라이언트 초기화 (lazy)"""
+        """Firestore 클라이언트 초기화 (lazy, project_id별 모듈 캐시 공유)"""
+        _load_google_errors()
         if self._db is not None:
             return self._db
 
-        import firebase_admin
-        from firebase_admin import firestore as fs_admin
+        cached = _DB_CACHE.get(self.project_id)
+        if cached is not None:
+            self._db = cached
+            return self._db
+
+        firebase_admin, fs_admin = _load_firebase()
 
         if not firebase_admin._apps:
             try:
@@ -81,9 +159,10 @@ class FirestoreClient:
             logger.error("Firestore client creation failed", exc_info=True)
             raise
 
+        _DB_CACHE[self.project_id] = self._db
         return self._db
 
-    def register_article(
+    def build_article(
         self,
         title: str,
         pdf_url: str,
@@ -92,20 +171,17 @@ class FirestoreClient:
         tags: List[str],
         article_type: str = "disease",
         visible: bool = True,
-    ) -> Optional[str]:
+    ) -> Optional[Dict[str, Any]]:
         """
-        Firestore articles 컬렉션에 문서 등록
+        articles 컬렉션 문서 데이터 생성 (등록은 하지 않음)
 
         Returns:
-            문서 ID 또는 None
+            문서 dict 또는 입력이 유효하지 않으면 None
         """
-        from firebase_admin import firestore as fs_admin
-
-        # Firestore 클라이언트 취득 — 초기화 실패 시 None 반환
         try:
-            db = self._get_db()
-        except Exception as e:
-            print(f"  ❌ Firestore 연결 실패: {e}")
+            _, fs_admin = _load_firebase()
+        except ImportError as e:
+            print(f"  ❌ Firestore 등록 실패: firebase_admin을 불러올 수 없습니다 ({e})")
             return None
 
         summary_text = analysis.get("summary", "")
@@ -121,30 +197,34 @@ class FirestoreClient:
             summary = f"{title}에 대해 알기 쉽게 정리한 슬라이드 자료입니다."
 
         # 본문: 첫 페이지 이미지 + 슬라이드 목차 + 전체 텍스트
-        content_parts = []
+        # 고정 3칸 튜플 — 빈 칸은 join 전에 filter로 제외 (리스트 증가 없음)
 
         # 첫 페이지 이미지를 content 최상단에 markdown으로 삽입
-        if thumb_url:
-            content_parts.append(f"![{title}]({thumb_url})\n")
+        image_part = f"![{title}]({thumb_url})\n" if thumb_url else ""
 
-        if summary_text:
-            content_parts.append(f"\n[슬라이드 목차]\n{summary_text}\n")
+        toc_part = f"\n[슬라이드 목차]\n{summary_text}\n" if summary_text else ""
 
-        # 전체 텍스트 (8000자 제한)
+        # 전체 텍스트 (UTF-8 24000바이트 제한 — 한글 약 8000자, Firestore 한도는 바이트 기준)
+        body_part = ""
         full_content = analysis.get("content", "")
         if full_content:
-            if len(full_content) > 8000:
-                full_content = full_content[:8000] + "\n\n... (이하 생략)"
-            content_parts.append(f"\n[전체 내용]\n{full_content}")
+            encoded = full_content.encode('utf-8')
+            if len(encoded) > _CONTENT_MAX_BYTES:
+                # 잘린 멀티바이트 문자 꼬리는 errors='ignore'로 버림
+                full_content = (
+                    encoded[:_CONTENT_MAX_BYTES].decode('utf-8', errors='ignore')
+                    + "\n\n... (이하 생략)"
+                )
+            body_part = f"\n[전체 내용]\n{full_content}"
 
         doc_data = {
             'title': title,
             'type': article_type,
             'tags': tags,
             'summary': summary[:200],
-            'content': "\n".join(content_parts),
+            'content': "\n".join(filter(None, (image_part, toc_part, body_part))),
             'attachmentUrl': pdf_url,
-            'attachmentName': Path(pdf_url).name,
+            'attachmentName': pdf_url.rsplit('/', 1)[-1],
             'images': [],
             'isVisible': visible,
             'createdAt': fs_admin.SERVER_TIMESTAMP,
@@ -158,8 +238,40 @@ class FirestoreClient:
             print("  ❌ Firestore 등록 실패: PDF URL이 비어 있습니다")
             return None
 
+        return doc_data
+
+    def register_article(
+        self,
+        title: str,
+        pdf_url: str,
+        thumb_url: Optional[str],
+        analysis: Dict[str, Any],
+        tags: List[str],
+        article_type: str = "disease",
+        visible: bool = True,
+    ) -> Optional[str]:
+        """
+        Firestore articles 컬렉션에 문서 등록
+
+        Returns:
+            문서 ID 또는 None
+        """
+        # Firestore 클라이언트 취득 — 초기화 실패 시 None 반환
+        try:
+            db = self._get_db()
+        except Exception as e:
+            print(f"  ❌ Firestore 연결 실패: {e}")
+            return None
+
+        doc_data = self.build_article(
+            title, pdf_url, thumb_url, analysis, tags,
+            article_type=article_type, visible=visible,
+        )
+        if doc_data is None:
+            return None
+
         def _do_add():
-            return db.collection('articles').add(doc_data)
+            return db.collection(_ARTICLES_COLLECTION).add(doc_data)
 
         try:
             # 일시적 오류에 대해 재시도
@@ -183,37 +295,108 @@ class FirestoreClient:
             _handle_firestore_error(e)
             return None
 
+    def register_articles_bulk(self, docs: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        build_article()로 만든 문서들을 WriteBatch/BulkWriter로 일괄 등록
+
+        문서 N건을 커밋당 최대 500건(Firestore 제한) 단위로 묶어
+        N회 add() 왕복을 ceil(N/500)회 commit()으로 줄인다.
+
+        500건을 넘으면 BulkWriter를 사용한다 — 커밋을 병렬로 보내고
+        쓰기 단위로 재시도/속도 조절(500/50/5 규칙)을 하므로 여러 묶음을
+        순차 커밋하는 것보다 처리량이 높다.
+
+        Returns:
+            docs 순서대로 문서 ID 목록 (쓰기 실패한 문서는 None)
+        """
+        if not docs:
+            return []
+
+        try:
+            db = self._get_db()
+        except Exception as e:
+            print(f"  ❌ Firestore 연결 실패: {e}")
+            return [None] * len(docs)
+
+        collection = db.collection(_ARTICLES_COLLECTION)
+        if len(docs) > _MAX_BATCH_WRITES and hasattr(db, "bulk_writer"):
+            doc_ids = self._bulk_write(db, collection, docs)
+        else:
+            doc_ids = self._batch_write(db, collection, docs)
+
+        registered = sum(1 for doc_id in doc_ids if doc_id)
+        print(f"  자료실 일괄 등록 완료: {registered}/{len(docs)}건")
+        return doc_ids
+
+    def _batch_write(self, db, collection, docs: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """WriteBatch로 최대 500건씩 순차 커밋 (실패한 묶음은 None)"""
+        doc_ids: List[Optional[str]] = []
+
+        for start in range(0, len(docs), _MAX_BATCH_WRITES):
+            chunk = docs[start:start + _MAX_BATCH_WRITES]
+            batch = db.batch()
+            refs = []
+            for doc_data in chunk:
+                ref = collection.document()
+                batch.set(ref, doc_data)
+                refs.append(ref)
+
+            try:
+                if _RETRYABLE_GOOGLE_ERRORS:
+                    _retry_sync(batch.commit, max_attempts=3, delay=2.0)
+                else:
+                    batch.commit()
+            except Exception as e:
+                _handle_firestore_error(e)
+                doc_ids.extend([None] * len(chunk))
+                continue
+
+            doc_ids.extend(ref.id for ref in refs)
+
+        return doc_ids
+
+    def _bulk_write(self, db, collection, docs: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """BulkWriter로 일괄 생성 (재시도 후에도 실패한 문서는 None)"""
+        refs = [collection.document() for _ in docs]
+        failed_ids = set()
+
+        def _on_write_error(failure) -> bool:
+            if failure.attempts < 3:
+                return True  # 재시도
+            failed_ids.add(failure.operation.reference.id)
+            print(f"  ❌ Firestore 쓰기 실패 ({failure.code}): {failure.message}")
+            return False
+
+        try:
+            bulk_writer = db.bulk_writer()
+            bulk_writer.on_write_error(_on_write_error)
+            for ref, doc_data in zip(refs, docs):
+                bulk_writer.create(ref, doc_data)
+            # 남은 쓰기를 모두 flush하고 완료를 기다림
+            bulk_writer.close()
+        except Exception as e:
+            # 어떤 쓰기가 반영됐는지 알 수 없으므로 전체를 실패로 보고
+            _handle_firestore_error(e)
+            return [None] * len(docs)
+
+        return [None if ref.id in failed_ids else ref.id for ref in refs]
+
 
 def _handle_firestore_error(e: Exception) -> None:
     """Firestore 예외를 구체적인 메시지로 처리"""
-    error_type = type(e).__name__
-    error_module = type(e).__module__
-
-    # google.api_core.exceptions 계층 감지
-    if 'google.api_core' in error_module or 'grpc' in error_module:
-        if 'NotFound' in error_type:
-            print(f"  ❌ Firestore 오류: 컬렉션/문서를 찾을 수 없습니다 (NotFound). "
-                  f"프로젝트 ID '{_get_project_hint()}' 를 확인하세요.")
-            logger.error(f"Firestore NotFound: {e}")
-        elif 'PermissionDenied' in error_type:
-            print(f"  ❌ Firestore 오류: 권한 없음 (PermissionDenied). "
-                  f"서비스 계정 권한 또는 Firestore 보안 규칙을 확인하세요.")
-            logger.error(f"Firestore PermissionDenied: {e}")
-        elif 'DeadlineExceeded' in error_type or 'Timeout' in error_type:
-            print(f"  ❌ Firestore 오류: 요청 타임아웃. 네트워크 연결을 확인하세요.")
-            logger.error(f"Firestore DeadlineExceeded: {e}")
-        elif 'Unauthenticated' in error_type:
-            print(f"  ❌ Firestore 오류: 인증 실패. GOOGLE_APPLICATION_CREDENTIALS 를 확인하세요.")
-            logger.error(f"Firestore Unauthenticated: {e}")
-        elif 'ResourceExhausted' in error_type:
-            print(f"  ❌ Firestore 오류: 할당량 초과 (ResourceExhausted). 잠시 후 재시도하세요.")
-            logger.error(f"Firestore ResourceExhausted: {e}")
-        elif 'ServiceUnavailable' in error_type:
-            print(f"  ❌ Firestore 오류: 서비스 일시 중단 (ServiceUnavailable). 잠시 후 재시도하세요.")
-            logger.error(f"Firestore ServiceUnavailable: {e}")
-        else:
-            print(f"  ❌ Firestore API 오류 ({error_type}): {e}")
-            logger.error(f"Firestore API error: {e}", exc_info=True)
+    _load_google_errors()
+    for error_cls, label, message in _FIRESTORE_ERROR_DISPATCH:
+        if isinstance(e, error_cls):
+            if '{project}' in message:
+                message = message.format(project=_get_project_hint())
+            print(f"  ❌ Firestore 오류: {message}")
+            logger.error("Firestore %s: %s", label, e)
+            return
+
+    # 그 밖의 google.api_core / grpc 오류
+    if isinstance(e, _GOOGLE_API_ERRORS) or 'grpc' in type(e).__module__:
+        print(f"  ❌ Firestore API 오류 ({type(e).__name__}): {e}")
+        logger.error(f"Firestore API error: {e}", exc_info=True)
     else:
         print(f"  ❌ Firestore 등록 실패: {e}")
         logger.error(f"Firestore unexpected error: {e}", exc_info=True)
@@ -222,8 +405,8 @@ def _handle_firestore_error(e: Exception) -> None:
 def _get_project_hint() -> str:
     """현재 Firebase 프로젝트 ID 힌트 반환"""
     try:
-        import firebase_admin
-        if firebase_admin._apps:
+        firebase_admin = _firebase_admin
+        if firebase_admin is not None and firebase_admin._apps:
             app = firebase_admin.get_app()
             return app.project_id or "unknown"
     except Exception:
@@ -4,32 +4,192 @@
 PDF 슬라이드 분석기 (PyMuPDF + Vision OCR 폴백)
 
 Performance optimizations applied (Team 3):
-- _ocr_with_vision: uses a persistent requests.Session() for all page requests
-  instead of a new TCP connection per page — saves ~100-200 ms per page for
-  HTTPS handshake overhead (critical for 15-20 page decks = up to 4 s saved).
+- _ocr_with_vision: uses a process-wide requests.Session (shared by every
+  PDFAnalyzer, closed at exit) and batches up to 16 pages per
+  images:annotate call (bounded by an 8 MB payload cap), so a 15-page deck
+  needs 1 round-trip instead of 15. Larger decks post
+  their batches concurrently from a thread pool while rendering continues.
 - analyze(): previously called extract_slide_titles() and extract_all_text()
   as two separate full document passes. Now a single _extract_titles_and_texts()
   pass collects both simultaneously, halving the PyMuPDF I/O work.
 - Pixmaps in _ocr_with_vision released immediately after tobytes() to avoid
-  accumulating all rendered bitmaps in memory.
+  accumulating all rendered bitmaps in memory; the encoded image bytes are
+  base64-encoded in the render helper and never outlive it.
+- OCR page rendering (CPU-bound, holds the GIL) is spread over the shared
+  get_render_pool() process pool for decks of 6+ pages; each worker keeps the
+  last PDF it opened, so a deck is opened once per worker.
+- render_thumbnail() renders by path so the pipeline can run it on the same
+  pool while analysis/OCR is still in progress.
+- OCR pages are uploaded as quality-90 JPEG instead of PNG, cutting the
+  base64 request body several-fold for the same recognition quality.
+- OCR render zoom is min(2.0, 1600 / long edge): small pages stay sharp,
+  oversized pages no longer render 3000+ px bitmaps.
+- analyze() probes the text layer with cheap "text" extraction first (stops
+  once 100 chars are seen); image-only scans skip the "dict" pass and go
+  straight to OCR.
+- clean_slide_text uses precompiled module-level patterns, applied in the
+  original order (each removal runs on the previous one's output).
 """
+import atexit
 import base64
 import os
 import re
-import sys
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
-
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+
+_VISION_API_URL = "https://vision.googleapis.com/v1/images:annotate"
+# images:annotate 1회 요청당 최대 이미지 수 (Vision API 제한)
+_VISION_BATCH_SIZE = 16
+# 요청 본문(base64 이미지 합계) 상한 — API 한도 10MB에 여유를 둠
+_VISION_MAX_PAYLOAD_BYTES = 8 * 1024 * 1024
+# 동시에 보낼 annotate 요청 수 (= HTTP 커넥션 풀 크기)
+_VISION_MAX_WORKERS = 8
+# OCR 업로드용 JPEG 품질 (텍스트 위주 슬라이드도 인식률 유지되는 수준)
+_OCR_JPEG_QUALITY = 90
+# PyMuPDF 추출 글자 수가 이보다 적으면 Vision OCR로 폴백
+_OCR_FALLBACK_MIN_CHARS = 100
+# OCR 렌더링 배율 상한과 목표 긴 변 길이(px)
+_OCR_MAX_ZOOM = 2.0
+_OCR_TARGET_LONG_EDGE = 1600
+
+# 키워드 추출: 한글 음절(가-힣) 외 문자 제거용 / 제외할 불용어
+_NON_HANGUL_RE = re.compile(r'[^\uac00-\ud7a3]+')
+_KEYWORD_STOPWORDS = frozenset({
+    "그리고", "하지만", "또한", "그래서", "때문에", "위해", "통해",
+    "경우", "등의", "대한", "있는", "없는", "하는", "되는", "이는",
+    "것이", "수술", "치료", "진단",
+})
+
+# clean_slide_text: 삭제할 잡음 패턴들 — 앞 패턴을 지운 결과에 다음 패턴을 적용하므로 순서 유지
+_SLIDE_NOISE_PATTERNS = (
+    # NotebookLM / Notebook LM 언급 (대소문자 무시, 앞뒤 공백/마침표 포함)
+    re.compile(r'[,.]?\s*A?\s*Notebook\s*LM\.?', re.IGNORECASE),
+    re.compile(r'[,.]?\s*노트북\s*LM\.?', re.IGNORECASE),
+    # 반복 ·E 패턴 (OCR 아티팩트: ·E·E·E·E...)
+    re.compile(r'(?:[·.]\s*E\s*){3,}'),
+    # ·가 3개 이상 반복되는 패턴
+    re.compile(r'(?:·\s*){3,}'),
+    # 0이 6개 이상 연속 (OCR 실패한 숫자)
+    re.compile(r'0{6,}'),
+)
+# 연속 공백 / 3개 이상 연속 빈 줄
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
+# 이 페이지 수 이상이면 OCR 렌더링을 프로세스 풀로 분산
+_PARALLEL_RENDER_MIN_PAGES = 6
+_RENDER_MAX_WORKERS = 4
+
+# OCR/썸네일 렌더링 공용 프로세스 풀 (get_render_pool()이 첫 호출 시 생성)
+_render_pool: Optional[ProcessPoolExecutor] = None
+_render_pool_lock = threading.Lock()
+
+# 렌더링 워커 프로세스별로 마지막에 연 문서와 그 키 (경로, 수정 시각)
+_worker_doc = None
+_worker_doc_key: Optional[Tuple[str, int]] = None
+
+
+def _render_ocr_image(page) -> str:
+    """페이지 하나를 OCR용 JPEG로 렌더링해 base64 문자열로 반환"""
+    import fitz
+    # PERF: 고정 2배 확대는 큰 페이지에서 긴 변이 3000px을 넘어 Vision 문서 OCR의
+    # 적정 해상도(~1600px)보다 훨씬 크다 — 긴 변 기준으로 배율 상한을 둔다.
+    rect = page.rect
+    zoom = min(_OCR_MAX_ZOOM, _OCR_TARGET_LONG_EDGE / max(rect.width, rect.height))
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+    # PERF: 렌더링된 슬라이드는 PNG보다 JPEG가 몇 배 작다 — Vision은 형식을
+    # 자동 감지하므로 업로드/base64 바이트만 줄어든다. 글자 가장자리가
+    # 뭉개지지 않도록 품질은 높게 유지.
+    # PERF: 인코딩된 이미지 bytes는 이름에 묶지 않고 바로 base64로 넘긴다 —
+    # 이 함수가 반환되면 pixmap과 원본 bytes가 함께 해제되어, 요청 본문을
+    # 만드는 동안 같은 페이지의 사본이 두 벌 남아 있지 않는다.
+    return base64.b64encode(
+        pix.tobytes("jpeg", jpg_quality=_OCR_JPEG_QUALITY)
+    ).decode('ascii')
+
+
+def _render_worker_page(pdf_path: str, mtime_ns: int, page_index: int) -> str:
+    """워커 프로세스에서 page_index 페이지를 OCR용 base64 이미지로 렌더링
+
+    공용 풀의 워커는 여러 PDF를 처리하므로, 마지막에 연 문서를
+    (경로, 수정 시각) 키로 보관해 같은 문서의 다음 페이지에서 재사용한다.
+    """
+    global _worker_doc, _worker_doc_key
+    key = (pdf_path, mtime_ns)
+    if _worker_doc_key != key:
+        import fitz
+        if _worker_doc is not None:
+            _worker_doc.close()
+            _worker_doc, _worker_doc_key = None, None
+        _worker_doc = fitz.open(pdf_path)
+        _worker_doc_key = key
+    return _render_ocr_image(_worker_doc[page_index])
+
+
+def _count_text_chars(texts: List[str], limit: int = _OCR_FALLBACK_MIN_CHARS) -> int:
+    """공백 제외 글자 수 합계 — limit에 도달하면 나머지 페이지는 세지 않고 반환
+
+    OCR 폴백 판단에는 기준 이상인지만 필요하므로, 기준 미만일 때만 정확한
+    합계가 된다 (로그 출력용).
+    """
+    total = 0
+    for text in texts:
+        total += len(text.strip())
+        if total >= limit:
+            break
+    return total
+
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """프로세스 전체가 공유하는 렌더링 프로세스 풀 (첫 호출 시 생성)"""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            workers = min(os.cpu_count() or 1, _RENDER_MAX_WORKERS)
+            _render_pool = ProcessPoolExecutor(max_workers=workers)
+        return _render_pool
+
+
+def render_thumbnail(pdf_path: str, page_num: int = 0, scale: float = 1.5) -> bytes:
+    """PDF를 직접 열어 특정 페이지의 썸네일 PNG 생성
+
+    PDFAnalyzer 인스턴스 없이 경로만 받으므로 get_render_pool() 워커
+    프로세스에서 실행할 수 있다 (PDFAnalyzer.generate_thumbnail과 같은 결과).
+    """
+    import fitz
+    doc = fitz.open(pdf_path)
+    try:
+        if len(doc) == 0:
+            return b""
+        page = doc[max(0, min(page_num, len(doc) - 1))]
+        return page.get_pixmap(matrix=fitz.Matrix(scale, scale)).tobytes("png")
+    finally:
+        doc.close()
 
 
 class PDFAnalyzer:
     """PDF 슬라이드 분석기"""
 
-    def __init__(self, pdf_path: Path, vision_api_key: str = ""):
+    # 프로세스 공용 Vision API 세션 — 배치 실행 시 주제가 바뀌어도 커넥션 재사용
+    _session = None
+    _session_lock = threading.Lock()
+
+    def __init__(self, pdf_path: Path, vision_api_key: str = "", fitz_lock=None):
+        """
+        Args:
+            pdf_path: 분석할 PDF 경로.
+            vision_api_key: Vision OCR 키 (없으면 환경 변수 사용).
+            fitz_lock: analyze() 안의 PyMuPDF 작업만 감쌀 락 (여러 스레드가
+                분석기를 동시에 쓸 때). Vision OCR 요청 동안에는 잡지 않는다.
+        """
         import fitz
         self.pdf_path = Path(pdf_path)
+        self._fitz_lock = fitz_lock if fitz_lock is not None else nullcontext()
         self.doc = fitz.open(str(self.pdf_path))
         self.page_count = len(self.doc)
         self.vision_api_key = vision_api_key or os.getenv('GOOGLE_CLOUD_VISION_API_KEY', '')
@@ -37,14 +197,28 @@ class PDFAnalyzer:
     def close(self):
         self.doc.close()
 
+    @classmethod
+    def _get_session(cls):
+        """Vision API용 requests.Session (첫 호출 시 생성, 인터프리터 종료 시 닫음)"""
+        with cls._session_lock:
+            if cls._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                # 어댑터 풀 크기 = 동시 annotate 요청 수 (urllib3가 커넥션을 직렬화하지 않도록)
+                session.mount("https://", HTTPAdapter(pool_maxsize=_VISION_MAX_WORKERS))
+                atexit.register(session.close)
+                cls._session = session
+            return cls._session
+
     def extract_all_text(self) -> List[str]:
         """페이지별 텍스트 추출 (PyMuPDF → Vision OCR 폴백)"""
         texts = []
         for page in self.doc:
             texts.append(page.get_text())
 
-        total_chars = sum(len(t.strip()) for t in texts)
-        if total_chars < 100:
+        total_chars = _count_text_chars(texts)
+        if total_chars < _OCR_FALLBACK_MIN_CHARS:
             print(f"  PyMuPDF 텍스트 부족 ({total_chars}자) → Vision OCR 시도...")
             ocr_texts = self._ocr_with_vision()
             if ocr_texts:
@@ -54,90 +228,185 @@ class PDFAnalyzer:
 
     def _ocr_with_vision(self) -> Optional[List[str]]:
         """Google Cloud Vision API로 OCR 폴백"""
-        import fitz
-        import requests
-
         if not self.vision_api_key:
             print("  Vision API 키 없음. OCR 건너뜀.")
             return None
 
-        api_url = "https://vision.googleapis.com/v1/images:annotate"
-        texts = []
-
-        # PERF BEFORE: requests.post() called bare on each page — each call
-        #              opens a new HTTPS connection (TLS handshake ~100-200 ms).
-        # PERF AFTER:  One Session() is created once and reused for all pages.
-        #              The underlying TCP connection is kept alive automatically,
-        #              saving ~100-200 ms × page_count (e.g. 15 pages = ~2-3 s).
-        with requests.Session() as session:
-            for i, page in enumerate(self.doc):
-                mat = fitz.Matrix(2.0, 2.0)
-                pix = page.get_pixmap(matrix=mat)
-                img_bytes = pix.tobytes("png")
-
-                # PERF: Release pixmap immediately — prevents all rendered
-                # bitmaps from accumulating in RAM across the full page loop.
-                pix = None
-
-                img_b64 = base64.b64encode(img_bytes).decode('utf-8')
-
-                payload = {
-                    "requests": [{
-                        "image": {"content": img_b64},
-                        "features": [{"type": "DOCUMENT_TEXT_DETECTION"}]
-                    }]
-                }
-
-                try:
-                    resp = session.post(
-                        f"{api_url}?key={self.vision_api_key}",
-                        json=payload,
-                        timeout=60,
-                    )
-                    result = resp.json()
-
-                    if 'error' in result:
-                        print(f"  Vision API 오류 (페이지 {i+1}): {result['error']}")
-                        texts.append("")
-                        continue
-
-                    responses = result.get('responses', [])
-                    if responses:
-                        full_text = responses[0].get('fullTextAnnotation', {}).get('text', '')
-                    else:
-                        full_text = ''
-                    texts.append(full_text)
-                    print(f"  OCR 페이지 {i+1}/{self.page_count}: {len(full_text)}자")
-                except Exception as e:
-                    print(f"  Vision OCR 실패 (페이지 {i+1}): {e}")
-                    texts.append("")
+        futures = []
+        batch: List[Dict[str, Any]] = []
+        batch_bytes = 0
+        batch_start = 0
+
+        # PERF: One process-wide Session (_get_session) is reused for every
+        #       request and every PDFAnalyzer (keep-alive, no repeated TLS
+        #       handshake per deck), and pages are sent in batches of up
+        #       to _VISION_BATCH_SIZE images per images:annotate call, so a
+        #       15-page deck costs 1 POST instead of 15.
+        # PERF: Full batches are posted from a thread pool while the next
+        #       pages are still being rendered; the adapter pool is sized to
+        #       the worker count so urllib3 does not serialise connections.
+        session = self._get_session()
+        with ThreadPoolExecutor(max_workers=_VISION_MAX_WORKERS) as executor:
+            for i, img_b64 in enumerate(self._iter_ocr_images()):
+                # 배치가 가득 찼거나 요청 본문 한도를 넘기면 먼저 전송
+                if batch and (
+                    len(batch) >= _VISION_BATCH_SIZE
+                    or batch_bytes + len(img_b64) > _VISION_MAX_PAYLOAD_BYTES
+                ):
+                    futures.append(executor.submit(
+                        self._annotate_batch, session, batch, batch_start
+                    ))
+                    batch, batch_bytes, batch_start = [], 0, i
+
+                batch.append({
+                    "image": {"content": img_b64},
+                    "features": [{"type": "DOCUMENT_TEXT_DETECTION"}]
+                })
+                batch_bytes += len(img_b64)
+
+            if batch:
+                futures.append(executor.submit(
+                    self._annotate_batch, session, batch, batch_start
+                ))
+
+            # 제출 순서 = 페이지 순서
+            texts = [text for future in futures for text in future.result()]
 
         total = sum(len(t.strip()) for t in texts)
         print(f"  Vision OCR 완료: 총 {total}자")
         return texts if total > 0 else None
 
+    def _iter_ocr_images(self) -> Iterator[str]:
+        """OCR용 페이지 이미지(base64)를 페이지 순서대로 생성
+
+        MuPDF 렌더링은 CPU 작업이고 GIL을 잡으므로, 페이지가 많으면
+        공용 get_render_pool() 프로세스 풀로 분산한다 (호출마다 풀을 새로
+        만들지 않는다). 작은 문서는 프로세스 간 전달 비용이 더 크므로
+        현재 프로세스에서 렌더링.
+        """
+        if self.page_count < _PARALLEL_RENDER_MIN_PAGES:
+            for page_index in range(self.page_count):
+                # 렌더링 동안만 fitz 락 — 앞 배치의 Vision 요청과는 겹쳐 실행
+                with self._fitz_lock:
+                    img_b64 = _render_ocr_image(self.doc[page_index])
+                yield img_b64
+            return
+
+        pdf_path = str(self.pdf_path)
+        mtime_ns = os.stat(pdf_path).st_mtime_ns
+        yield from get_render_pool().map(
+            partial(_render_worker_page, pdf_path, mtime_ns),
+            range(self.page_count),
+        )
+
+    def _annotate_batch(
+        self,
+        session,
+        image_requests: List[Dict[str, Any]],
+        first_page: int,
+    ) -> List[str]:
+        """images:annotate 1회 호출로 여러 페이지 OCR
+
+        Args:
+            session: 재사용할 requests.Session
+            image_requests: 페이지 순서대로 정렬된 AnnotateImageRequest 목록
+            first_page: 첫 요청의 0-based 페이지 번호 (로그용)
+
+        Returns:
+            image_requests와 같은 길이/순서의 페이지별 텍스트 (실패 시 "")
+        """
+        count = len(image_requests)
+        page_range = f"{first_page + 1}-{first_page + count}"
+
+        try:
+            resp = session.post(
+                f"{_VISION_API_URL}?key={self.vision_api_key}",
+                json={"requests": image_requests},
+                timeout=120,
+            )
+            result = resp.json()
+        except Exception as e:
+            print(f"  Vision OCR 실패 (페이지 {page_range}): {e}")
+            return [""] * count
+
+        if 'error' in result:
+            print(f"  Vision API 오류 (페이지 {page_range}): {result['error']}")
+            return [""] * count
+
+        # responses[]는 요청 순서와 1:1로 대응
+        responses = result.get('responses', [])
+        texts = []
+        for offset in range(count):
+            page_no = first_page + offset + 1
+            response = responses[offset] if offset < len(responses) else {}
+            if 'error' in response:
+                print(f"  Vision API 오류 (페이지 {page_no}): {response['error']}")
+                texts.append("")
+                continue
+            full_text = response.get('fullTextAnnotation', {}).get('text', '')
+            texts.append(full_text)
+            print(f"  OCR 페이지 {page_no}/{self.page_count}: {len(full_text)}자")
+        return texts
+
+    def _probe_text_layer(self) -> Tuple[List[str], int, List[Tuple[Any, Any]]]:
+        """페이지별 plain text를 모으며 글자 수를 세다가 OCR 기준을 넘으면 중단
+
+        Returns:
+            (지금까지 읽은 페이지 텍스트, 공백 제외 누적 글자 수, 해당 페이지들의
+            (Page, TextPage) 쌍). 글자 수가 기준 미만이면 목록은 전체 페이지를
+            담고 있다. TextPage는 Page를 약한 참조로 가리키므로 함께 보관한다.
+        """
+        import fitz
+        texts: List[str] = []
+        textpages: List[Tuple[Any, Any]] = []
+        chars = 0
+        for page in self.doc:
+            # PERF: TextPage(콘텐츠 스트림 파싱 결과)를 직접 만들어 두면
+            # _extract_titles_and_texts의 "dict" 추출이 재사용할 수 있다.
+            # get_text() 기본값과 같은 플래그 (공백/탭·합자 보존 — 0이면 탭이 U+FFFD로 바뀜)
+            textpage = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+            text = page.get_text(textpage=textpage)
+            textpages.append((page, textpage))
+            texts.append(text)
+            chars += len(text.strip())
+            if chars >= _OCR_FALLBACK_MIN_CHARS:
+                break
+        return texts, chars, textpages
+
     def extract_slide_titles(self) -> List[str]:
         """각 슬라이드의 제목(큰 글씨) 추출"""
         titles, _ = self._extract_titles_and_texts()
         return titles
 
-    def _extract_titles_and_texts(self) -> Tuple[List[str], List[str]]:
+    def _extract_titles_and_texts(
+        self, textpages: Optional[List[Tuple[Any, Any]]] = None
+    ) -> Tuple[List[str], List[str]]:
         """
         PERF: Single document pass that collects both slide titles and plain text.
 
         Previously analyze() called extract_slide_titles() and extract_all_text()
         as two independent loops over the full document — 2× the PyMuPDF I/O.
-        This method does one pass and returns both results simultaneously.
+        This method does one pass and returns both results simultaneously,
+        and both outputs are read from one TextPage parse per page.
+
+        Args:
+            textpages: 앞쪽 페이지들에 대해 이미 만든 (Page, TextPage) 쌍
+                (있으면 재사용)
         """
+        import fitz
+        textpages = textpages or []
         titles: List[str] = []
         texts: List[str] = []
 
-        for page in self.doc:
-            # --- plain text ---
-            texts.append(page.get_text())
-
-            # --- title (largest font span on the page) ---
-            blocks = page.get_text("dict", flags=0)
+        for page_index, page in enumerate(self.doc):
+            if page_index < len(textpages):
+                page, textpage = textpages[page_index]
+            else:
+                textpage = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+            # PERF: 콘텐츠 스트림은 TextPage로 페이지당 한 번만 파싱하고,
+            # 일반 텍스트(get_text() 기본 출력 그대로)와 제목용 "dict"를 모두 그것에서 읽는다
+            texts.append(page.get_text("text", textpage=textpage))
+            blocks = page.get_text("dict", textpage=textpage)
             best_text = ""
             best_size = 0
             for block in blocks.get("blocks", []):
@@ -177,19 +446,10 @@ class PDFAnalyzer:
     @staticmethod
     def clean_slide_text(text: str) -> str:
         """슬라이드 텍스트에서 NotebookLM 언급, OCR 아티팩트 등 제거"""
-        # NotebookLM / Notebook LM 언급 제거 (대소문자 무시, 앞뒤 공백/마침표 포함)
-        text = re.sub(r'[,.]?\s*A?\s*Notebook\s*LM\.?', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'[,.]?\s*노트북\s*LM\.?', '', text, flags=re.IGNORECASE)
-        # 반복 ·E 패턴 제거 (OCR 아티팩트: ·E·E·E·E...)
-        text = re.sub(r'(?:[·.]\s*E\s*){3,}', '', text)
-        # ·가 3개 이상 반복되는 패턴 제거
-        text = re.sub(r'(?:·\s*){3,}', '', text)
-        # 0이 6개 이상 연속 → 빈 문자열 (OCR 실패한 숫자)
-        text = re.sub(r'0{6,}', '', text)
-        # 연속 공백 정리
-        text = re.sub(r' {2,}', ' ', text)
-        # 빈 줄이 3개 이상이면 2개로
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        for pattern in _SLIDE_NOISE_PATTERNS:
+            text = pattern.sub('', text)
+        text = _MULTI_SPACE_RE.sub(' ', text)
+        text = _EXCESS_NEWLINES_RE.sub('\n\n', text)
         return text.strip()
 
     def build_content(self) -> str:
@@ -216,18 +476,31 @@ class PDFAnalyzer:
         """
         print(f"  PDF 분석: {self.pdf_path.name} ({self.page_count}페이지)")
 
-        # PERF: One document pass instead of up to four separate passes.
-        titles, raw_texts = self._extract_titles_and_texts()
+        # PERF: 저렴한 "text" 모드로 텍스트 레이어를 먼저 확인 (보통 첫 페이지에서
+        # 종료). 글자가 하나도 없는 스캔본이면 제목도 나올 수 없으므로 "dict"
+        # 파싱을 건너뛰고 바로 OCR로 간다.
+        # fitz 락은 텍스트 추출 동안만 — 네트워크 대기인 Vision OCR은 락 밖에서
+        with self._fitz_lock:
+            probe_texts, probe_chars, textpages = self._probe_text_layer()
+            if probe_chars == 0:
+                titles, raw_texts = [], probe_texts
+            else:
+                # PERF: One document pass instead of up to four separate passes.
+                # 확인 단계에서 만든 TextPage를 재사용해 같은 페이지를 다시 파싱하지 않음
+                titles, raw_texts = self._extract_titles_and_texts(textpages)
+            del textpages
 
         # OCR fallback when PyMuPDF extracted too little text
-        total_chars_raw = sum(len(t.strip()) for t in raw_texts)
-        if total_chars_raw < 100:
+        total_chars_raw = _count_text_chars(raw_texts)
+        if total_chars_raw < _OCR_FALLBACK_MIN_CHARS:
             print(f"  PyMuPDF 텍스트 부족 ({total_chars_raw}자) → Vision OCR 시도...")
             ocr_texts = self._ocr_with_vision()
             if ocr_texts:
                 raw_texts = ocr_texts
 
-        full_text = " ".join(t.strip() for t in raw_texts if t.strip())
+        # 페이지당 strip()은 한 번만 (긴 OCR 텍스트의 사본 생성을 절반으로)
+        stripped = [t.strip() for t in raw_texts]
+        full_text = " ".join(t for t in stripped if t)
         keywords = self._extract_keywords(full_text)
 
         # Build summary from already-computed titles (no extra document pass)
@@ -261,17 +534,12 @@ class PDFAnalyzer:
 
     def _extract_keywords(self, text: str, top_n: int = 15) -> List[str]:
         """텍스트에서 주요 키워드 추출"""
-        stopwords = {
-            "그리고", "하지만", "또한", "그래서", "때문에", "위해", "통해",
-            "경우", "등의", "대한", "있는", "없는", "하는", "되는", "이는",
-            "것이", "수술", "치료", "진단",
-        }
-
-        words = {}
+        # PERF: 한글 외 문자 제거는 C 정규식 스캐너로, 빈도 집계는 Counter로.
+        # most_common(n)은 전체 정렬 대신 heapq.nlargest (동률은 등장 순서 유지)
+        counts = Counter()
         for word in text.split():
-            clean = "".join(c for c in word if '\uac00' <= c <= '\ud7a3')
-            if 2 <= len(clean) <= 6 and clean not in stopwords:
-                words[clean] = words.get(clean, 0) + 1
+            clean = _NON_HANGUL_RE.sub('', word)
+            if 2 <= len(clean) <= 6 and clean not in _KEYWORD_STOPWORDS:
+                counts[clean] += 1
 
-        sorted_words = sorted(words.items(), key=lambda x: x[1], reverse=True)
-        return [w for w, _ in sorted_words[:top_n]]
+        return [w for w, _ in counts.most_common(top_n)]
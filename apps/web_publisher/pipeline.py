@@ -3,30 +3,35 @@
 """
 WebPublishPipeline - NotebookLM → PDF 분석 → 자료실 등록
 """
+import asyncio
 import logging
-import sys
+import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
-
-logger = logging.getLogger(__name__)
-
-# noterang 패키지 경로 추가
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from noterang import Noterang, WorkflowResult
 from noterang.config import NoterangConfig, get_config
 from noterang.prompts import SlidePrompts
 
 from .config import WebPublisherConfig
 from .body_parts import BODY_PARTS, match_body_part
-from .pdf_analyzer import PDFAnalyzer
+from .pdf_analyzer import PDFAnalyzer, get_render_pool, render_thumbnail
 from .file_manager import FileManager
 from .firestore_client import FirestoreClient
 
+logger = logging.getLogger(__name__)
+
+# PyMuPDF(fitz)는 스레드 안전하지 않음 — 배치 워커들의 fitz 호출을 직렬화 (OCR 요청은 제외)
+_PDF_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _slide_prompts() -> SlidePrompts:
+    """프로세스 공용 SlidePrompts (slide_prompts.json은 처음 한 번만 파싱)"""
+    return SlidePrompts()
+
 
 class WebPublishPipeline:
     """전체 파이프라인: NotebookLM → PDF 분석 → 자료실 등록"""
@@ -43,6 +48,7 @@ class WebPublishPipeline:
         slide_count: int = 15,
         noterang_config: NoterangConfig = None,
         publisher_config: WebPublisherConfig = None,
+        defer_register: bool = False,
     ):
         self.title = title
         self.queries = queries
@@ -54,6 +60,8 @@ class WebPublishPipeline:
         self.slide_count = slide_count
         self.noterang_config = noterang_config or get_config()
         self.publisher_config = publisher_config or WebPublisherConfig.load()
+        # True면 Firestore에 직접 쓰지 않고 결과의 "article"로 문서를 넘김
+        self.defer_register = defer_register
 
     def get_research_queries(self) -> List[str]:
         """한의학 제외, 정형외과 관점 검색 쿼리 생성"""
@@ -69,8 +77,7 @@ class WebPublishPipeline:
 
     def get_focus_prompt(self) -> str:
         """디자인 스타일 + 한글 + 쉬운 설명 프롬프트"""
-        prompts = SlidePrompts()
-        design_prompt = prompts.get_prompt(self.design) or ""
+        design_prompt = _slide_prompts().get_prompt(self.design) or ""
 
         return f"""{design_prompt}
 
@@ -143,6 +150,44 @@ class WebPublishPipeline:
             return f"PDF 파일이 비어 있습니다 (0 bytes): {pdf_path}"
         return None
 
+    def _analyze_pdf(self, pdf_path: Path) -> Dict[str, Any]:
+        """
+        PDF 분석 (동기 — asyncio.to_thread로 실행).
+
+        PyMuPDF는 스레드 안전하지 않으므로 배치 워커 간에 _PDF_LOCK으로
+        직렬화한다. 락은 문서 열기/닫기와 analyze() 안의 fitz 작업에만
+        걸리고, 네트워크 대기인 Vision OCR 요청 동안에는 풀려 있어 다른
+        워커가 분석을 진행할 수 있다. analyze() 예외는 호출자에게 그대로
+        전파된다. 썸네일은 run()이 별도 프로세스에서 동시에 렌더링한다.
+
+        Returns:
+            PDFAnalyzer.analyze() 결과 dict.
+        """
+        with _PDF_LOCK:
+            analyzer = PDFAnalyzer(
+                pdf_path, self.publisher_config.vision_api_key, fitz_lock=_PDF_LOCK,
+            )
+        try:
+            return analyzer.analyze()
+        finally:
+            try:
+                with _PDF_LOCK:
+                    analyzer.close()
+            except Exception as e:
+                logger.warning(f"PDFAnalyzer.close() error (ignored): {e}")
+
+    @staticmethod
+    async def _collect_thumbnail(thumb_job: "asyncio.Future") -> Optional[bytes]:
+        """프로세스 풀에서 렌더링 중인 첫 페이지 썸네일 결과 수집"""
+        try:
+            thumbnail = await thumb_job
+            return thumbnail if thumbnail else None
+        except Exception as e:
+            # 썸네일 실패는 치명적이지 않음 — 경고 후 계속
+            print(f"  ⚠️ 썸네일 생성 실패 (건너뜀): {e}")
+            logger.warning(f"Thumbnail generation failed: {e}")
+            return None
+
     async def run(self) -> Dict[str, Any]:
         """전체 파이프라인 실행"""
         start_time = time.time()
@@ -190,42 +235,30 @@ class WebPublishPipeline:
             if path_error:
                 return {"success": False, "error": path_error}
 
-        # Step 2: PDF 분석
+        # Step 2: PDF 분석 (블로킹 작업 → 워커 스레드, 이벤트 루프는 다른 워커 진행)
+        # 첫 페이지 썸네일은 별도 프로세스에서 동시에 렌더링 — 분석/OCR 대기 뒤에 숨김
         print("\n[2/4] PDF 슬라이드 분석...")
-        analyzer = None
+        thumb_job = asyncio.get_running_loop().run_in_executor(
+            get_render_pool(), render_thumbnail, str(pdf_path),
+        )
         try:
-            analyzer = PDFAnalyzer(pdf_path, self.publisher_config.vision_api_key)
-            try:
-                analysis = analyzer.analyze()
-            except Exception as e:
-                elapsed = int(time.time() - start_time)
-                error_msg = f"PDF 분석 실패: {e}"
-                print(f"  ❌ {error_msg}")
-                logger.error(f"PDFAnalyzer.analyze failed: {pdf_path}", exc_info=True)
-                return {"success": False, "error": error_msg, "duration": elapsed}
-
-            try:
-                thumbnail = analyzer.generate_thumbnail(0) if getattr(analyzer, 'page_count', 0) > 0 else None
-                analysis["thumbnail"] = thumbnail if thumbnail else None
-            except Exception as e:
-                # 썸네일 실패는 치명적이지 않음 — 경고 후 계속
-                print(f"  ⚠️ 썸네일 생성 실패 (건너뜀): {e}")
-                logger.warning(f"Thumbnail generation failed: {e}")
-                analysis["thumbnail"] = None
-
-        finally:
-            if analyzer is not None:
-                try:
-                    analyzer.close()
-                except Exception as e:
-                    logger.warning(f"PDFAnalyzer.close() error (ignored): {e}")
+            analysis = await asyncio.to_thread(self._analyze_pdf, pdf_path)
+        except Exception as e:
+            thumb_job.cancel()
+            elapsed = int(time.time() - start_time)
+            error_msg = f"PDF 분석 실패: {e}"
+            print(f"  ❌ {error_msg}")
+            logger.error(f"PDFAnalyzer.analyze failed: {pdf_path}", exc_info=True)
+            return {"success": False, "error": error_msg, "duration": elapsed}
+        analysis["thumbnail"] = await self._collect_thumbnail(thumb_job)
 
         # Step 3: 파일 복사
         print("\n[3/4] 웹앱에 파일 복사...")
         try:
             file_mgr = FileManager(self.publisher_config.uploads_dir)
-            pdf_url, thumb_url = file_mgr.copy_pdf_and_thumbnail(
-                pdf_path, self.title, analysis.get("thumbnail")
+            pdf_url, thumb_url = await asyncio.to_thread(
+                file_mgr.copy_pdf_and_thumbnail,
+                pdf_path, self.title, analysis.get("thumbnail"),
             )
         except PermissionError as e:
             elapsed = int(time.time() - start_time)
@@ -248,12 +281,32 @@ class WebPublishPipeline:
 
         # Step 4: 자료실 등록
         doc_id = None
-        if self.register:
+        article = None
+        if self.register and self.defer_register:
+            # 배치 모드: 문서만 만들어 두고 BatchPublisher가 WriteBatch로 일괄 등록
+            print("\n[4/4] 자료실 등록 데이터 준비 (배치 일괄 등록)...")
+            tags = self.generate_tags(analysis.get("keywords", []))
+            client = FirestoreClient(self.publisher_config.firebase_project_id)
+            try:
+                article = client.build_article(
+                    title=self.title,
+                    pdf_url=pdf_url,
+                    thumb_url=thumb_url,
+                    analysis=analysis,
+                    tags=tags,
+                    article_type=self.article_type,
+                    visible=self.visible,
+                )
+            except Exception as e:
+                print(f"  ⚠️ 자료실 등록 데이터 생성 실패 (파일은 복사됨): {e}")
+                logger.error("Firestore build_article raised an exception", exc_info=True)
+        elif self.register:
             print("\n[4/4] 자료실 등록...")
             tags = self.generate_tags(analysis.get("keywords", []))
             client = FirestoreClient(self.publisher_config.firebase_project_id)
             try:
-                doc_id = client.register_article(
+                doc_id = await asyncio.to_thread(
+                    client.register_article,
                     title=self.title,
                     pdf_url=pdf_url,
                     thumb_url=thumb_url,
@@ -291,7 +344,7 @@ class WebPublishPipeline:
         print(f"  소요시간: {elapsed}초")
         print("=" * 60)
 
-        return {
+        result = {
             "success": True,
             "title": self.title,
             "notebook_id": notebook_id,
@@ -302,3 +355,7 @@ class WebPublishPipeline:
             "page_count": analysis.get("page_count", 0),
             "duration": elapsed,
         }
+        if article is not None:
+            # 일괄 등록 대기 문서 — BatchPublisher가 꺼내 쓰고 제거함
+            result["article"] = article
+        return result
@@ -25,120 +25,135 @@ Usage:
 
 __version__ = "2.0.0"
 
-# Config
-from .config import (
-    NoterangConfig,
-    get_config,
-    set_config,
-    init_config,
-)
-
-# Core
-from .core import (
-    Noterang,
-    WorkflowResult,
-    run_automation,
-    run_automation_sync,
-    run_batch,
-)
-
-# NLM Client (Python API)
-from .nlm_client import (
-    get_nlm_client,
-    close_nlm_client,
-    check_nlm_auth,
-    is_client_expired,
-    NLMClientError,
-    NLMAuthError,
-)
-
-# Auth
-from .auth import (
-    auto_login,
-    ensure_auth,
-    check_auth,
-    sync_auth,
-    run_auto_login,
-    run_ensure_logged_in,
-)
-
-# Notebook
-from .notebook import (
-    NotebookManager,
-    get_notebook_manager,
-    list_notebooks,
-    find_notebook,
-    create_notebook,
-    delete_notebook,
-    get_or_create_notebook,
-    start_research,
-    check_research_status,
-    import_research,
-)
-
-# Artifacts
-from .artifacts import (
-    ArtifactManager,
-    create_slides,
-    create_infographic,
-    check_studio_status,
-    is_generation_complete,
-    wait_for_completion,
-    create_slides_and_wait,
-    create_infographic_and_wait,
-)
-
-# Download
-from .download import (
-    download_via_browser,
-    download_with_retries,
-    download_sync,
-    take_screenshot,
-)
-
-# Convert
-from .convert import (
-    Converter,
-    pdf_to_pptx,
-    pdf_to_pptx_with_notes,
-    add_notes_to_pptx,
-    batch_convert,
-    apply_template,
-    create_styled_pptx,
-    extract_text_from_pdf,
-)
-
-# Browser (Playwright 기반 직접 제어)
-from .browser import (
-    NotebookLMBrowser,
-    run_with_browser,
-)
-
-# Prompts (100개 슬라이드 디자인 프롬프트)
-from .prompts import (
-    SlidePrompts,
-    get_slide_prompts,
-    list_slide_styles,
-    get_slide_prompt,
-    search_slide_styles,
-    print_style_catalog,
-)
-
-# Workflow (기본 워크플로우)
-from .workflow import (
-    NoterangWorkflow,
-    run_workflow,
-    select_design,
-    print_design_menu,
-    DESIGN_PRESETS,
-    MEDICAL_DESIGNS,
-)
-
-# Converter (PDF → PPTX)
-from .converter import (
-    pdf_to_pptx as convert_pdf_to_pptx,
-    batch_convert as batch_convert_pdf,
-)
+import importlib
+
+# 공개 API는 처음 접근할 때 해당 서브모듈을 import (PEP 562)
+# — `from noterang import init_config`가 브라우저/변환/워크플로우 모듈까지 끌어오지 않도록
+_LAZY_EXPORTS = {
+    # Config
+    ".config": (
+        "NoterangConfig",
+        "get_config",
+        "set_config",
+        "init_config",
+    ),
+    # Core
+    ".core": (
+        "Noterang",
+        "WorkflowResult",
+        "run_automation",
+        "run_automation_sync",
+        "run_batch",
+    ),
+    # NLM Client (Python API)
+    ".nlm_client": (
+        "get_nlm_client",
+        "close_nlm_client",
+        "check_nlm_auth",
+        "is_client_expired",
+        "NLMClientError",
+        "NLMAuthError",
+    ),
+    # Auth
+    ".auth": (
+        "auto_login",
+        "ensure_auth",
+        "check_auth",
+        "sync_auth",
+        "run_auto_login",
+        "run_ensure_logged_in",
+    ),
+    # Notebook
+    ".notebook": (
+        "NotebookManager",
+        "get_notebook_manager",
+        "list_notebooks",
+        "find_notebook",
+        "create_notebook",
+        "delete_notebook",
+        "get_or_create_notebook",
+        "start_research",
+        "check_research_status",
+        "import_research",
+    ),
+    # Artifacts
+    ".artifacts": (
+        "ArtifactManager",
+        "create_slides",
+        "create_infographic",
+        "check_studio_status",
+        "is_generation_complete",
+        "wait_for_completion",
+        "create_slides_and_wait",
+        "create_infographic_and_wait",
+    ),
+    # Download
+    ".download": (
+        "download_via_browser",
+        "download_with_retries",
+        "download_sync",
+        "take_screenshot",
+    ),
+    # Convert
+    ".convert": (
+        "Converter",
+        "pdf_to_pptx",
+        "pdf_to_pptx_with_notes",
+        "add_notes_to_pptx",
+        "batch_convert",
+        "apply_template",
+        "create_styled_pptx",
+        "extract_text_from_pdf",
+    ),
+    # Browser (Playwright 기반 직접 제어)
+    ".browser": (
+        "NotebookLMBrowser",
+        "run_with_browser",
+    ),
+    # Prompts (100개 슬라이드 디자인 프롬프트)
+    ".prompts": (
+        "SlidePrompts",
+        "get_slide_prompts",
+        "list_slide_styles",
+        "get_slide_prompt",
+        "search_slide_styles",
+        "print_style_catalog",
+    ),
+    # Workflow (기본 워크플로우)
+    ".workflow": (
+        "NoterangWorkflow",
+        "run_workflow",
+        "select_design",
+        "print_design_menu",
+        "DESIGN_PRESETS",
+        "MEDICAL_DESIGNS",
+    ),
+}
+
+# 공개 이름 → (서브모듈, 원래 이름)
+_LAZY_ATTRS = {
+    name: (module, name)
+    for module, names in _LAZY_EXPORTS.items()
+    for name in names
+}
+# Converter (PDF → PPTX) — convert 모듈과 이름이 겹쳐 별칭으로 노출
+_LAZY_ATTRS["convert_pdf_to_pptx"] = (".converter", "pdf_to_pptx")
+_LAZY_ATTRS["batch_convert_pdf"] = (".converter", "batch_convert")
+
+
+def __getattr__(name):
+    try:
+        module, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), attr)
+    globals()[name] = value  # 이후 접근은 일반 모듈 속성 조회
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # Version
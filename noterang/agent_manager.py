@@ -19,7 +19,7 @@ from enum import Enum
 import threading
 import queue
 
-if sys.platform == 'win32':
+if sys.platform == 'win32' and sys.stdout.encoding.lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
 class AgentStatus(Enum):
@@ -280,7 +280,10 @@ class AgentManager:
 
                 # 진행 상황 출력
                 if check_count % 3 == 0:
-                    print(f"\r    체크 #{check_count}: {int(elapsed)}초 경과...", end="", flush=True)
+                    if sys.stdout.isatty():
+                        print(f"\r    체크 #{check_count}: {int(elapsed)}초 경과...", end="", flush=True)
+                    else:
+                        print(f"    체크 #{check_count}: {int(elapsed)}초 경과...")
 
                 await asyncio.sleep(check_interval)
 
@@ -370,12 +373,9 @@ class NoterangMultiAgent:
             print(f"  ❌ 생성 시작 실패: {stderr[:100]}")
             return None
 
-        # Artifact ID 추출
-        artifact_id = None
-        for line in stdout.split('\n'):
-            if 'Artifact ID:' in line:
-                artifact_id = line.split('Artifact ID:')[1].strip()
-                break
+        # Artifact ID 추출 (줄 단위 split 대신 첫 마커 뒤 한 줄만 partition)
+        _, marker, rest = stdout.partition('Artifact ID:')
+        artifact_id = rest.partition('\n')[0].strip() if marker else None
 
         print(f"  Artifact ID: {artifact_id}")
 
@@ -460,11 +460,8 @@ class NoterangMultiAgent:
             return False, 0
 
         # Task ID 추출
-        task_id = None
-        for line in stdout.split('\n'):
-            if 'Task ID:' in line:
-                task_id = line.split('Task ID:')[1].strip()
-                break
+        _, marker, rest = stdout.partition('Task ID:')
+        task_id = rest.partition('\n')[0].strip() if marker else None
 
         # 완료 체크 함수
         def check_completion():
@@ -484,7 +481,7 @@ class NoterangMultiAgent:
             imported = 0
             if "Imported" in stdout:
                 try:
-                    imported = int(stdout.split("Imported")[1].split("source")[0].strip())
+                    imported = int(stdout.partition("Imported")[2].partition("source")[0].strip())
                 except:
                     pass
             return True, imported
@@ -6,20 +6,43 @@
 - 스튜디오 상태 확인: Python API (병렬 안전)
 """
 import asyncio
+import json
 import logging
+import re
 import sys
 import time
 from typing import Optional, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
-if sys.platform == 'win32':
+if sys.platform == 'win32' and sys.stdout.encoding.lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
 from .config import get_config
 from .nlm_client import get_nlm_client
 from .auth import run_nlm
 
+# CLI 텍스트 출력의 상태 키워드 (in_progress는 progress로 함께 매치)
+_STATUS_KEYWORD_RE = re.compile(r'completed|progress|failed', re.IGNORECASE)
+# 텍스트 폴백 우선순위: completed > in_progress > failed
+_STATUS_PRIORITY = (("completed", "completed"), ("progress", "in_progress"), ("failed", "failed"))
+
+# CLI stdout의 Artifact ID — 줄 단위 split 대신 원문에서 1회 검색
+_ARTIFACT_ID_RE = re.compile(r'Artifact ID:[ \t]*(\S+)')
+# 인포그래픽: "Artifact ID: x" 또는 JSON/키-값 형태의 "id": "x" / id=x
+_INFOGRAPHIC_ID_RE = re.compile(
+    r'(?:Artifact ID|["\']?\bid["\']?)[ \t]*[:=][ \t]*["\']?([^\s"\',]+)', re.IGNORECASE
+)
+
+# wait_for_completion 적응형 폴링: 2초에서 시작해 1.5배씩 늘려 check_interval에서 고정
+_POLL_INITIAL_INTERVAL = 2.0
+_POLL_BACKOFF = 1.5
+
+# check_studio_status 단기 캐시: notebook_id → (조회 시각, status, data)
+# 여러 경로가 연달아 상태를 물을 때 nlm 조회를 한 번만 하도록 (생성 시작 시 무효화)
+_STATUS_CACHE_TTL = 0.5
+_status_cache: Dict[str, Tuple[float, str, Dict]] = {}
+
 
 async def retry_async(coro_func, max_attempts: int = 3, delay: float = 2.0, backoff: float = 2.0, exceptions=(Exception,)):
     """Retry an async function with exponential backoff."""
@@ -55,8 +78,7 @@ def create_slides(
     Returns:
         Artifact ID 또는 None
     """
-    config = get_config()
-    lang = language or config.default_language  # 기본: 한글!
+    lang = language or get_config().default_language  # 기본: 한글!
 
     args = ["slides", "create", notebook_id, "--language", lang]
     if focus:
@@ -65,6 +87,7 @@ def create_slides(
         args.append("--confirm")
 
     print(f"  슬라이드 생성 시작 (언어: {lang})...")
+    _status_cache.pop(notebook_id, None)
     success, stdout, stderr = run_nlm(args, timeout=60)
 
     if not success:
@@ -74,11 +97,11 @@ def create_slides(
     # "Slide deck generation started" 확인
     if "started" in stdout.lower() or "생성" in stdout:
         # Artifact ID가 있으면 추출
-        for line in stdout.split('\n'):
-            if 'Artifact ID:' in line:
-                artifact_id = line.split('Artifact ID:')[1].strip()
-                print(f"  Artifact ID: {artifact_id}")
-                return artifact_id
+        match = _ARTIFACT_ID_RE.search(stdout)
+        if match:
+            artifact_id = match.group(1)
+            print(f"  Artifact ID: {artifact_id}")
+            return artifact_id
         # Artifact ID 없어도 시작된 것으로 처리
         print(f"  ✓ 생성 시작됨 (ID 추출 불가 — poll로 확인)")
         return "pending"
@@ -105,14 +128,14 @@ def create_infographic(
     Returns:
         Artifact ID 또는 None
     """
-    config = get_config()
-    lang = language or config.default_language
+    lang = language or get_config().default_language
 
     args = ["infographic", "create", notebook_id, "--language", lang, "--style", style]
     if focus:
         args.extend(["--focus", focus])
 
     print(f"  인포그래픽 생성 시작 (스타일: {style})...")
+    _status_cache.pop(notebook_id, None)
     success, stdout, stderr = run_nlm(args, timeout=60)
 
     if not success:
@@ -120,11 +143,9 @@ def create_infographic(
         return None
 
     if "started" in stdout.lower() or "생성" in stdout:
-        for line in stdout.split('\n'):
-            if 'Artifact ID:' in line or 'id' in line.lower():
-                parts = line.split(':')
-                if len(parts) > 1:
-                    return parts[1].strip().strip('"')
+        match = _INFOGRAPHIC_ID_RE.search(stdout)
+        if match:
+            return match.group(1)
         return "pending"
 
     return None
@@ -134,6 +155,8 @@ def check_studio_status(notebook_id: str) -> Tuple[str, Dict]:
     """
     스튜디오 상태 확인 (Python API → CLI fallback)
 
+    _STATUS_CACHE_TTL 이내의 같은 노트북 재조회는 직전 결과를 반환 ("unknown"은 캐시하지 않음)
+
     Returns:
         (status, full_response)
         status: "completed", "in_progress", "failed", "unknown"
@@ -142,6 +165,19 @@ def check_studio_status(notebook_id: str) -> Tuple[str, Dict]:
         logger.warning("check_studio_status called with empty notebook_id")
         return "unknown", {"error": "notebook_id가 비어 있습니다"}
 
+    now = time.monotonic()
+    cached = _status_cache.get(notebook_id)
+    if cached and now - cached[0] < _STATUS_CACHE_TTL:
+        return cached[1], cached[2]
+
+    status, data = _fetch_studio_status(notebook_id)
+    if status != "unknown":
+        _status_cache[notebook_id] = (now, status, data)
+    return status, data
+
+
+def _fetch_studio_status(notebook_id: str) -> Tuple[str, Dict]:
+    """check_studio_status 본체 — 캐시 없이 Python API → CLI 순으로 조회"""
     # Python API 시도
     try:
         client = get_nlm_client()
@@ -166,9 +202,8 @@ def check_studio_status(notebook_id: str) -> Tuple[str, Dict]:
             logger.warning(f"nlm studio status failed: {stderr[:200]}")
             return "unknown", {"error": stderr[:500]}
 
-        import json as _json
         try:
-            data = _json.loads(stdout)
+            data = json.loads(stdout)
             if isinstance(data, list):
                 if len(data) == 0:
                     return "in_progress", {"raw": stdout}
@@ -177,17 +212,14 @@ def check_studio_status(notebook_id: str) -> Tuple[str, Dict]:
                     return status, data[0]
             elif isinstance(data, dict):
                 return data.get("status", "unknown"), data
-        except _json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:
             logger.debug(f"check_studio_status: JSON parse failed: {e}")
 
-        # 텍스트 파싱 폴백
-        lower = stdout.lower()
-        if "completed" in lower:
-            return "completed", {"raw": stdout}
-        elif "in_progress" in lower or "progress" in lower:
-            return "in_progress", {"raw": stdout}
-        elif "failed" in lower:
-            return "failed", {"raw": stdout}
+        # 텍스트 파싱 폴백 — lower() 사본 + 키워드별 부분 문자열 스캔 대신 1회 정규식 스캔
+        found = {m.group(0).lower() for m in _STATUS_KEYWORD_RE.finditer(stdout)}
+        for keyword, status in _STATUS_PRIORITY:
+            if keyword in found:
+                return status, {"raw": stdout}
 
         return "unknown", {"raw": stdout[:500]}
 
@@ -217,17 +249,17 @@ async def wait_for_completion(
     Args:
         notebook_id: 노트북 ID
         timeout: 최대 대기 시간 (초)
-        check_interval: 체크 간격 (초)
+        check_interval: 최대 체크 간격 (초) — 짧은 간격에서 시작해 이 값까지 증가
         on_progress: 진행 콜백 (elapsed_seconds, status)
 
     Returns:
         완료 여부
     """
-    config = get_config()
-    max_wait = timeout or config.timeout_slides
+    max_wait = timeout or get_config().timeout_slides
 
     start_time = time.time()
     check_count = 0
+    interval = min(_POLL_INITIAL_INTERVAL, check_interval)
 
     while True:
         elapsed = time.time() - start_time
@@ -250,9 +282,14 @@ async def wait_for_completion(
             return False
 
         if check_count % 3 == 0:
-            print(f"\r  체크 #{check_count}: {int(elapsed)}초 경과...", end="", flush=True)
-
-        await asyncio.sleep(check_interval)
+            # 로그 파일로 리다이렉트된 경우 줄 덮어쓰기/강제 flush 없이 일반 줄로
+            if sys.stdout.isatty():
+                print(f"\r  체크 #{check_count}: {int(elapsed)}초 경과...", end="", flush=True)
+            else:
+                print(f"  체크 #{check_count}: {int(elapsed)}초 경과...")
+
+        await asyncio.sleep(interval)
+        interval = min(interval * _POLL_BACKOFF, check_interval)
 
 
 async def create_slides_and_wait(
@@ -7,6 +7,7 @@
 - 쿠키 관리
 """
 import asyncio
+import hashlib
 import json
 import logging
 import os
@@ -17,13 +18,44 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Tuple
 
-if sys.platform == 'win32':
+if sys.platform == 'win32' and sys.stdout.encoding.lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
 from .config import get_config
 
 logger = logging.getLogger(__name__)
 
+# 인증 파일 직렬화 — orjson(C 확장)이 있으면 사용, 없으면 표준 json
+try:
+    import orjson
+
+    def _dumps_indented(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_canonical(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    def _dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+    def _dumps_canonical(obj) -> bytes:
+        return json.dumps(obj, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+# sync_to_profile 마지막 기록 내용의 지문 (프로필 디렉토리 안)
+_PROFILE_HASH_FILE = '.auth.hash'
+_PROFILE_FILES = ('cookies.json', 'metadata.json', 'auth.json')
+
+# ensure_auth 결과 재사용 시간 (초) — 동시 호출/연속 호출 시 중복 확인·로그인 방지
+_AUTH_CACHE_TTL = 300
+_auth_lock: Optional[asyncio.Lock] = None
+_auth_lock_loop = None
+_auth_verified_at: Optional[float] = None
+
+# 앱 비밀번호 로그인 셀렉터 / 재시도 간격 (초)
+_APP_PASSWORD_RETRY_INTERVAL = 5
+_PASSWORD_INPUT_SELECTOR = 'input[type="password"]'
+_NEXT_BUTTON_SELECTOR = 'button:has-text("Next"), button:has-text("다음")'
+
 
 async def auto_login(headless: bool = True, timeout: int = 60) -> bool:
     """
@@ -62,8 +94,7 @@ async def auto_login(headless: bool = True, timeout: int = 60) -> bool:
                     '--no-default-browser-check',
                 ],
                 ignore_default_args=['--enable-automation'],
-                viewport={'width': 1280, 'height': 800} if headless else None,
-                no_viewport=not headless,
+                viewport={'width': 1280, 'height': 800},
             )
         except PlaywrightError as e:
             print(f"  ❌ 브라우저 시작 실패: {e}")
@@ -92,60 +123,44 @@ async def auto_login(headless: bool = True, timeout: int = 60) -> bool:
         print("[3/4] 로그인 상태 확인...")
 
         logged_in = False
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            url = page.url
-
-            # 로그인 페이지로 리다이렉트 되었는지 확인
-            if 'accounts.google.com' in url:
-                if headless:
-                    print("  ⚠️ 로그인 필요 - headless 모드에서 불가")
-                    await context.close()
-                    return False
-                else:
-                    # 앱 비밀번호가 있으면 자동 입력 시도
-                    app_password = config.notebooklm_app_password
-                    if app_password:
-                        await _try_app_password_login(page, app_password)
-
-                    print("  로그인 페이지 감지 - 대기 중...")
-                    await asyncio.sleep(5)
-                    continue
-
-            # NotebookLM 메인 페이지에 있는지 확인
-            if 'notebooklm.google.com' in url and 'accounts.google' not in url:
-                cookies = await context.cookies()
-                google_cookies = [c for c in cookies if 'google.com' in c.get('domain', '')]
-                cookie_names = {c['name'] for c in google_cookies}
-                has_sid = 'SID' in cookie_names
-                has_psid = '__Secure-1PSID' in cookie_names or '__Secure-3PSID' in cookie_names
-
-                if has_sid and has_psid and len(google_cookies) > 10:
+        deadline = time.time() + timeout
+
+        # 로그인 페이지로 리다이렉트 되었는지 확인
+        if 'accounts.google.com' in page.url:
+            if headless:
+                print("  ⚠️ 로그인 필요 - headless 모드에서 불가")
+                await context.close()
+                return False
+            print("  로그인 페이지 감지 - 대기 중...")
+
+        # 2초 간격 page.url 폴링 대신 NotebookLM 도착 내비게이션을 이벤트로 대기
+        # (로그인 페이지에 머무는 동안은 앱 비밀번호 입력을 주기적으로 재시도)
+        if await _wait_for_notebooklm(
+            page, deadline, '' if headless else config.notebooklm_app_password,
+            PlaywrightTimeoutError, fail_on_login_page=headless,
+        ):
+            # 리다이렉트 직후 세션 쿠키가 늦게 붙을 수 있어 남은 시간 안에서 재확인
+            while True:
+                cookies_dict, has_sid, has_psid, google_count = _summarize_google_cookies(
+                    await context.cookies()
+                )
+
+                if has_sid and has_psid and google_count > 10:
                     logged_in = True
-                    print(f"  ✓ 로그인 확인 (쿠키 {len(google_cookies)}개)")
+                    print(f"  ✓ 로그인 확인 (쿠키 {google_count}개)")
                     break
-
-            await asyncio.sleep(2)
-            elapsed = int(time.time() - start_time)
-            print(f"\r  확인 중... {elapsed}초", end="", flush=True)
+                if time.time() >= deadline:
+                    break
+                await asyncio.sleep(1)
 
         if not logged_in:
             print("\n  ❌ 로그인 실패 또는 타임아웃")
             await context.close()
             return False
 
-        # 쿠키 추출 및 저장
+        # 쿠키 저장 (로그인 확인 때 요약한 google.com 쿠키 dict 재사용)
         print("\n[4/4] 인증 정보 저장...")
 
-        cookies = await context.cookies()
-
-        # 쿠키를 딕셔너리로 변환
-        cookies_dict = {}
-        for cookie in cookies:
-            if 'google.com' in cookie.get('domain', ''):
-                cookies_dict[cookie['name']] = cookie['value']
-
         # CSRF 토큰 생성
         sapisid = cookies_dict.get('SAPISID', cookies_dict.get('__Secure-3PAPISID', ''))
         csrf_token = f"{sapisid[:16]}:{int(time.time() * 1000)}" if sapisid else ""
@@ -182,9 +197,9 @@ async def auto_login(headless: bool = True, timeout: int = 60) -> bool:
             await context.close()
             return False
 
-        # 프로필 디렉토리에 동기화
+        # 프로필 디렉토리에 동기화 (파일 3개 쓰기는 워커 스레드에서 — 이벤트 루프 비차단)
         try:
-            sync_to_profile(auth_data)
+            await asyncio.to_thread(sync_to_profile, auth_data)
         except Exception as e:
             # 동기화 실패는 치명적이지 않음 — 경고만 출력
             print(f"  ⚠️ 프로필 동기화 실패 (무시): {e}")
@@ -203,11 +218,74 @@ async def auto_login(headless: bool = True, timeout: int = 60) -> bool:
     return True
 
 
+def _summarize_google_cookies(cookies: list) -> Tuple[Dict[str, str], bool, bool, int]:
+    """
+    google.com 쿠키를 한 번 순회하며 로그인 판정에 필요한 값만 추출
+
+    Returns:
+        (이름→값 dict, SID 존재, __Secure-1PSID/3PSID 존재, google.com 쿠키 수)
+    """
+    cookies_dict = {}
+    has_sid = has_psid = False
+    count = 0
+    for cookie in cookies:
+        if 'google.com' not in cookie.get('domain', ''):
+            continue
+        name = cookie['name']
+        cookies_dict[name] = cookie['value']
+        count += 1
+        if name == 'SID':
+            has_sid = True
+        elif name == '__Secure-1PSID' or name == '__Secure-3PSID':
+            has_psid = True
+    return cookies_dict, has_sid, has_psid, count
+
+
+def _is_notebooklm_url(url: str) -> bool:
+    """NotebookLM 본 페이지 여부 (Google 로그인 페이지 제외)"""
+    return 'notebooklm.google.com' in url and 'accounts.google' not in url
+
+
+async def _wait_for_notebooklm(
+    page, deadline: float, app_password: str, timeout_error,
+    fail_on_login_page: bool = False,
+) -> bool:
+    """
+    NotebookLM 도착까지 대기 (deadline까지)
+
+    accounts.google.com에 있는 동안 앱 비밀번호 입력을 _APP_PASSWORD_RETRY_INTERVAL초마다
+    재시도한다 — 이메일 단계가 먼저 뜨면 비밀번호 필드가 나중에 생기기 때문.
+
+    Args:
+        timeout_error: wait_for_url 시간 초과 예외 클래스 (Playwright TimeoutError)
+        fail_on_login_page: True면 로그인 페이지로 리다이렉트되는 즉시 False 반환
+            (headless 모드는 직접 로그인할 수 없으므로 타임아웃까지 기다리지 않음)
+    """
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return False
+        if fail_on_login_page and 'accounts.google.com' in page.url:
+            print("  ⚠️ 로그인 필요 - headless 모드에서 불가")
+            return False
+        if app_password and 'accounts.google.com' in page.url:
+            await _try_app_password_login(page, app_password)
+            remaining = max(deadline - time.time(), 0.001)
+        try:
+            await page.wait_for_url(
+                _is_notebooklm_url,
+                timeout=min(remaining, _APP_PASSWORD_RETRY_INTERVAL) * 1000,
+            )
+            return True
+        except timeout_error:
+            continue
+
+
 async def _try_app_password_login(page, app_password: str):
     """앱 비밀번호로 로그인 시도"""
     try:
         # 비밀번호 입력 필드 찾기
-        password_input = await page.query_selector('input[type="password"]')
+        password_input = await page.query_selector(_PASSWORD_INPUT_SELECTOR)
         if password_input:
             # 앱 비밀번호 입력 (공백 제거)
             clean_password = app_password.replace(' ', '')
@@ -215,7 +293,7 @@ async def _try_app_password_login(page, app_password: str):
             await asyncio.sleep(0.5)
 
             # 다음 버튼 클릭
-            next_btn = await page.query_selector('button:has-text("Next"), button:has-text("다음")')
+            next_btn = await page.query_selector(_NEXT_BUTTON_SELECTOR)
             if next_btn:
                 await next_btn.click()
                 await asyncio.sleep(3)
@@ -224,8 +302,29 @@ async def _try_app_password_login(page, app_password: str):
         print(f"  앱 비밀번호 입력 실패: {e}")
 
 
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 교체 — 중간에 끊겨도 읽는 쪽이 잘린 JSON을 보지 않음"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _profile_is_current(profile_dir: Path, fingerprint: str) -> bool:
+    """지난번과 같은 auth_data로 이미 동기화되어 있고 파일도 모두 남아 있는지"""
+    try:
+        if (profile_dir / _PROFILE_HASH_FILE).read_text(encoding='utf-8') != fingerprint:
+            return False
+    except OSError:
+        return False
+    return all((profile_dir / name).exists() for name in _PROFILE_FILES)
+
+
 def sync_to_profile(auth_data: dict):
-    """프로필 디렉토리에 인증 정보 동기화"""
+    """프로필 디렉토리에 인증 정보 동기화 (내용이 같으면 다시 쓰지 않음)"""
     config = get_config()
 
     try:
@@ -235,6 +334,11 @@ def sync_to_profile(auth_data: dict):
     except OSError as e:
         raise OSError(f"프로필 디렉토리 생성 실패: {config.profile_dir}: {e}") from e
 
+    # check_auth → sync_auth가 매번 같은 루트 auth.json을 넘기므로 지문이 같으면 건너뜀
+    fingerprint = hashlib.blake2b(_dumps_canonical(auth_data), digest_size=16).hexdigest()
+    if _profile_is_current(config.profile_dir, fingerprint):
+        return
+
     # cookies.json (리스트 형식)
     raw_cookies = auth_data.get('cookies', {})
     if isinstance(raw_cookies, list):
@@ -270,13 +374,18 @@ def sync_to_profile(auth_data: dict):
     for filename, data in files_to_write.items():
         file_path = config.profile_dir / filename
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            _atomic_write_bytes(file_path, _dumps_indented(data))
         except PermissionError as e:
             raise PermissionError(f"파일 저장 권한 없음: {file_path}") from e
         except OSError as e:
             raise OSError(f"파일 저장 실패 ({filename}): {e}") from e
 
+    # 지문은 세 파일을 모두 쓴 뒤에 기록 (중간 실패 시 다음 호출에서 다시 씀)
+    try:
+        _atomic_write_bytes(config.profile_dir / _PROFILE_HASH_FILE, fingerprint.encode('ascii'))
+    except OSError as e:
+        logger.debug(f"sync_to_profile: hash file write failed: {e}")
+
 
 def sync_auth() -> bool:
     """인증 동기화 (루트 → 프로필)"""
@@ -308,25 +417,42 @@ def sync_auth() -> bool:
     return True
 
 
-def run_nlm(args: list, timeout: int = 120) -> Tuple[bool, str, str]:
-    """nlm CLI 실행 (notebook.py, artifacts.py 호환용)"""
+# nlm 하위 프로세스에 덮어쓸 환경 변수
+_NLM_ENV_OVERRIDES = {'PYTHONIOENCODING': 'utf-8'}
+
+
+def _nlm_env() -> dict:
+    """nlm 하위 프로세스 환경 (호출 시점의 os.environ + 고정 덮어쓰기 항목)"""
+    return {**os.environ, **_NLM_ENV_OVERRIDES}
+
+
+def _nlm_command(args: list) -> Tuple[Optional[list], Optional[dict], str]:
+    """nlm 실행 명령/환경 구성 — (cmd, env, '') 또는 실행 파일이 없으면 (None, None, 오류 메시지)"""
     config = get_config()
 
     nlm_exe = config.nlm_exe
     if not Path(nlm_exe).exists():
         msg = f"nlm 실행 파일을 찾을 수 없습니다: {nlm_exe}"
         logger.error(msg)
-        return False, '', msg
+        return None, None, msg
 
     cmd = [str(nlm_exe)] + args
-    env = os.environ.copy()
-    env['PYTHONIOENCODING'] = 'utf-8'
+    return cmd, _nlm_env(), ''
+
+
+def run_nlm(args: list, timeout: int = 120) -> Tuple[bool, str, str]:
+    """nlm CLI 실행 (notebook.py, artifacts.py 호환용)"""
+    cmd, env, error = _nlm_command(args)
+    if cmd is None:
+        return False, '', error
+    nlm_exe = cmd[0]
 
     try:
-        result = subprocess.run(cmd, capture_output=True, timeout=timeout, env=env)
-        stdout = result.stdout.decode('utf-8', errors='replace') if result.stdout else ''
-        stderr = result.stderr.decode('utf-8', errors='replace') if result.stderr else ''
-        return result.returncode == 0, stdout, stderr
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, encoding='utf-8', errors='replace',
+            timeout=timeout, env=env,
+        )
+        return result.returncode == 0, result.stdout or '', result.stderr or ''
     except subprocess.TimeoutExpired:
         msg = f"nlm 실행 타임아웃 ({timeout}초): {' '.join(args[:3])}"
         logger.error(msg)
@@ -345,6 +471,47 @@ def run_nlm(args: list, timeout: int = 120) -> Tuple[bool, str, str]:
         return False, '', msg
 
 
+async def arun_nlm(args: list, timeout: int = 120) -> Tuple[bool, str, str]:
+    """nlm CLI 비동기 실행 — run_nlm과 같은 결과, 대기 중에도 이벤트 루프를 막지 않음"""
+    cmd, env, error = _nlm_command(args)
+    if cmd is None:
+        return False, '', error
+    nlm_exe = cmd[0]
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
+    except FileNotFoundError:
+        msg = f"nlm 실행 파일을 실행할 수 없습니다: {nlm_exe}"
+        logger.error(msg)
+        return False, '', msg
+    except PermissionError as e:
+        msg = f"nlm 실행 권한 없음: {e}"
+        logger.error(msg)
+        return False, '', msg
+    except OSError as e:
+        msg = f"nlm 실행 OS 오류: {e}"
+        logger.error(msg)
+        return False, '', msg
+
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        msg = f"nlm 실행 타임아웃 ({timeout}초): {' '.join(args[:3])}"
+        logger.error(msg)
+        return False, '', msg
+
+    stdout = out.decode('utf-8', errors='replace') if out else ''
+    stderr = err.decode('utf-8', errors='replace') if err else ''
+    return proc.returncode == 0, stdout, stderr
+
+
 def check_auth() -> bool:
     """인증 확인 (Python API 직접 호출)"""
     sync_auth()
@@ -352,8 +519,49 @@ def check_auth() -> bool:
     return check_nlm_auth()
 
 
+def _auth_cache_valid() -> bool:
+    """최근 확인한 인증 결과를 재사용해도 되는지 (캐시 TTL 이내 + 클라이언트 미만료)"""
+    from .nlm_client import is_client_expired
+
+    return (
+        _auth_verified_at is not None
+        and time.monotonic() - _auth_verified_at < _AUTH_CACHE_TTL
+        and not is_client_expired()
+    )
+
+
+def _get_auth_lock() -> asyncio.Lock:
+    """현재 이벤트 루프용 인증 Lock (asyncio.run 을 여러 번 호출해도 안전하도록 루프별 생성)"""
+    global _auth_lock, _auth_lock_loop
+    loop = asyncio.get_running_loop()
+    if _auth_lock is None or _auth_lock_loop is not loop:
+        _auth_lock = asyncio.Lock()
+        _auth_lock_loop = loop
+    return _auth_lock
+
+
 async def ensure_auth() -> bool:
-    """인증 확인 및 필요시 자동 로그인 (TTL 만료 자동 감지)"""
+    """
+    인증 확인 및 필요시 자동 로그인 (TTL 만료 자동 감지)
+
+    동시에 여러 코루틴이 호출해도 실제 확인/로그인은 하나만 수행하고,
+    나머지는 그 결과를 기다렸다가 재사용한다 (브라우저 중복 실행 방지).
+    """
+    global _auth_verified_at
+
+    if _auth_cache_valid():
+        return True
+
+    async with _get_auth_lock():
+        if _auth_cache_valid():
+            return True
+        ok = await _ensure_auth()
+        _auth_verified_at = time.monotonic() if ok else None
+        return ok
+
+
+async def _ensure_auth() -> bool:
+    """ensure_auth 본체 — API 확인 후 headless → 브라우저 순으로 자동 로그인"""
     from .nlm_client import is_client_expired, close_nlm_client
 
     config = get_config()
@@ -6,13 +6,17 @@
 - 브라우저 자동화로 NotebookLM 로그인
 """
 import asyncio
+import json
 import logging
 import os
+import re
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Tuple
 
-if sys.platform == 'win32':
+if sys.platform == 'win32' and sys.stdout.encoding.lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
 import pyotp
@@ -21,31 +25,87 @@ from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
-# .env.local 파일 로드
-env_path = Path(__file__).parent.parent / '.env.local'
-load_dotenv(env_path)
 
-# 인증 정보 (환경 변수에서 로드)
-EMAIL = os.getenv('GOOGLE_EMAIL', '')
-PASSWORD = os.getenv('GOOGLE_PASSWORD', '')
-TOTP_SECRET = os.getenv('GOOGLE_2FA_SECRET', '')
-APP_PASSWORD = os.getenv('NOTEBOOKLM_APP_PASSWORD', '')
-APIFY_API_KEY = os.getenv('APIFY_API_KEY', '')
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """.env.local 파일 로드 (import 시점이 아니라 처음 필요할 때 한 번만)"""
+    load_dotenv(Path(__file__).parent.parent / '.env.local')
+
+
+# 인증 정보 (환경 변수에서 지연 로드)
+def _email() -> str:
+    _load_env()
+    return os.getenv('GOOGLE_EMAIL', '')
+
+
+def _password() -> str:
+    _load_env()
+    return os.getenv('GOOGLE_PASSWORD', '')
+
+
+def _totp_secret() -> str:
+    _load_env()
+    return os.getenv('GOOGLE_2FA_SECRET', '')
+
 
 # 브라우저 프로필 경로
 BROWSER_PROFILE = Path.home() / '.notebooklm-auto-v3'
 
-
-def get_totp_code() -> str:
-    """현재 TOTP 코드 생성"""
-    if not TOTP_SECRET:
+# 로그인용 Chromium 실행 옵션 — 자동화 표식 제거 (헤드리스/창 모드 공통)
+_CHROMIUM_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-infobars',
+    '--no-first-run',
+    '--no-default-browser-check',
+)
+
+# 헤드리스 실행에만 추가 — 로그인에 불필요한 백그라운드 서비스 끄기
+# (GPU 프로세스, 컴포넌트 업데이트, 동기화, 번역 등: 시작 시간/메모리 절감)
+# 창 모드에서는 사용자가 직접 2FA/캡차를 처리하므로 GPU·확장 프로그램을 그대로 둔다
+_HEADLESS_CHROMIUM_ARGS = (
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-extensions',
+    '--disable-sync',
+    '--metrics-recording-only',
+    '--disable-translate',
+    '--disable-features=MediaRouter,OptimizationHints,InterestFeedContentSuggestions',
+)
+
+
+def _chromium_args(headless: bool) -> list:
+    """launch_persistent_context에 넘길 Chromium 인자 (헤드리스면 경량화 옵션 추가)"""
+    if headless:
+        return [*_CHROMIUM_ARGS, *_HEADLESS_CHROMIUM_ARGS]
+    return list(_CHROMIUM_ARGS)
+
+# 로그인 중 차단할 요청 — 폰트/미디어와 분석·광고 추적 (이미지는 캡차/본인 확인 화면에 필요해 통과)
+_LOGIN_BLOCKED_RESOURCE_TYPES = frozenset({'font', 'media'})
+_LOGIN_BLOCKED_URL_MARKERS = ('google-analytics.com', 'googletagmanager.com', 'doubleclick.net')
+
+
+# TOTP 코드 갱신 주기 (초)
+_TOTP_PERIOD = 30
+
+
+@lru_cache(maxsize=1)
+def _totp() -> pyotp.TOTP:
+    """TOTP 객체 (비밀키는 프로세스 동안 고정이므로 한 번만 생성)"""
+    return pyotp.TOTP(_totp_secret().upper(), interval=_TOTP_PERIOD)
+
+
+def get_totp_code(for_time: Optional[int] = None) -> str:
+    """현재(또는 for_time 시점의) TOTP 코드 생성"""
+    if not _totp_secret():
         raise ValueError(
             "GOOGLE_2FA_SECRET 환경 변수가 설정되지 않았습니다. "
             ".env.local 파일을 확인하세요."
         )
     try:
-        totp = pyotp.TOTP(TOTP_SECRET.upper())
-        code = totp.now()
+        code = _totp().now() if for_time is None else _totp().at(for_time)
         if not code or len(code) != 6:
             raise ValueError(f"유효하지 않은 TOTP 코드 생성됨: '{code}'")
         return code
@@ -53,6 +113,20 @@ def get_totp_code() -> str:
         raise RuntimeError(f"TOTP 코드 생성 실패: {e}") from e
 
 
+def _fresh_totp_code() -> Tuple[str, int]:
+    """
+    입력할 TOTP 코드와 입력 전 대기 시간(초)
+
+    현재 코드가 3초 안에 만료되면 다음 주기의 코드를 미리 생성해 두고,
+    호출자는 대기 후 바로 입력한다 (깨어난 뒤 코드 생성 지연 없음).
+    """
+    now = int(time.time())
+    remaining = _TOTP_PERIOD - (now % _TOTP_PERIOD)
+    if remaining <= 3:
+        return get_totp_code(for_time=now + remaining + 1), remaining + 1
+    return get_totp_code(), 0
+
+
 _LOCKOUT_INDICATORS = [
     "계정이 일시적으로 사용 중지",
     "too many failed attempts",
@@ -61,16 +135,81 @@ _LOCKOUT_INDICATORS = [
     "verify it's you",
     "계정을 확인해야",
 ]
+# 지표 전체를 한 번의 대소문자 무시 검색으로 확인 (본문 소문자 복사본 불필요)
+_LOCKOUT_RE = re.compile('|'.join(map(re.escape, _LOCKOUT_INDICATORS)), re.IGNORECASE)
+
+
+# Google 로그인 화면 셀렉터 (호출마다 문자열을 다시 만들지 않도록 모듈 상수로)
+# 오류 메시지 컨테이너 — 잘못된 비밀번호/OTP
+# 보이는 컨테이너의 텍스트를 evaluate 한 번으로 읽음 (셀렉터별 query + inner_text 왕복 제거)
+_LOGIN_ERROR_TEXT_JS = """
+() => {
+    for (const el of document.querySelectorAll('[jsname="B34EJ"], [aria-live="assertive"]')) {
+        if (!el.getClientRects().length || getComputedStyle(el).visibility === 'hidden') continue;
+        const text = el.innerText.trim();
+        if (text) return text;
+    }
+    return '';
+}
+"""
+# TOTP 입력 필드: 최초 확인 / 방식 전환 후 / 재입력
+_TOTP_INPUT_SELECTOR = (
+    'input[name="totpPin"], input[type="tel"][autocomplete="one-time-code"], input[id="totpPin"]'
+)
+_TOTP_INPUT_ANY_SELECTOR = (
+    'input[name="totpPin"], input[type="tel"], input[id="totpPin"], input[autocomplete="one-time-code"]'
+)
+_TOTP_INPUT_RETRY_SELECTOR = 'input[name="totpPin"], input[type="tel"], input[id="totpPin"]'
+_TOTP_NEXT_SELECTOR = '#totpNext, button:has-text("다음"), button:has-text("Next")'
+# Push 알림 → OTP 방식 전환
+_TRY_ANOTHER_WAY_SELECTORS = ('text=다른 방법 시도', 'text=Try another way', 'text=Try a different way')
+_OTP_OPTION_SELECTORS = (
+    'text=Google OTP',
+    'text=Authenticator',
+    'text=인증 앱',
+    'text=OTP 앱',
+    '[data-challengetype="6"]',
+    '[data-challengetype="5"]',
+)
+# 후보 셀렉터 중 페이지에 존재하는 첫 번째를 반환 ('text=' 는 본문 텍스트 포함 여부로 판정)
+_FIRST_PRESENT_JS = """
+(selectors) => {
+    const text = document.body ? document.body.innerText.toLowerCase() : '';
+    return selectors.find((sel) => sel.startsWith('text=')
+        ? text.includes(sel.slice(5).toLowerCase())
+        : document.querySelector(sel) !== null) || null;
+}
+"""
+# 첫 화면 준비 조건 — NotebookLM에 도착했거나 로그인 입력 필드가 나타나면 참
+_LOGIN_PAGE_READY_JS = (
+    "() => location.hostname === 'notebooklm.google.com'"
+    " || !!document.querySelector('input[type=\"email\"], input[type=\"password\"]')"
+)
+# 2FA 화면 준비 조건 — TOTP 입력 필드 또는 "다른 방법 시도" 링크가 나타나면 참
+_TOTP_SCREEN_READY_JS = (
+    f"() => !!document.querySelector({json.dumps(_TOTP_INPUT_SELECTOR)})"
+    f" || {json.dumps([sel[len('text='):].lower() for sel in _TRY_ANOTHER_WAY_SELECTORS])}"
+    ".some((t) => document.body && document.body.innerText.toLowerCase().includes(t))"
+)
+# 제출 후 다음 화면 대기 조건 — 비밀번호/OTP 화면을 벗어났거나 오류가 표시되면 참
+_PASSWORD_SUBMITTED_JS = (
+    "() => !location.href.includes('/challenge/pwd')"
+    f" || ({_LOGIN_ERROR_TEXT_JS.strip()})() !== ''"
+)
+_TOTP_SUBMITTED_JS = (
+    f"() => !document.querySelector({json.dumps(_TOTP_INPUT_RETRY_SELECTOR)})"
+    f" || ({_LOGIN_ERROR_TEXT_JS.strip()})() !== ''"
+)
 
 
 def _check_credentials() -> None:
     """필수 인증 정보가 설정되어 있는지 검증"""
     missing = []
-    if not EMAIL:
+    if not _email():
         missing.append("GOOGLE_EMAIL")
-    if not PASSWORD:
+    if not _password():
         missing.append("GOOGLE_PASSWORD")
-    if not TOTP_SECRET:
+    if not _totp_secret():
         missing.append("GOOGLE_2FA_SECRET")
     if missing:
         raise ValueError(
@@ -79,12 +218,20 @@ def _check_credentials() -> None:
         )
 
 
-async def full_auto_login(headless: bool = False) -> bool:
+async def full_auto_login(
+    headless: bool = False,
+    playwright=None,
+    context=None,
+    page=None,
+) -> bool:
     """
     완전 자동 로그인
 
     Args:
         headless: True면 백그라운드 실행
+        playwright: 이미 시작된 Playwright 인스턴스 (주면 드라이버를 새로 띄우지 않고 재사용)
+        context: 이미 열린 브라우저 컨텍스트 (주면 새로 띄우지 않고 그 안에서 로그인, 닫지 않음)
+        page: context 안에서 사용할 페이지 (없으면 첫 페이지 또는 새 페이지)
 
     Returns:
         로그인 성공 여부
@@ -99,148 +246,201 @@ async def full_auto_login(headless: bool = False) -> bool:
         print(f"  ❌ 인증 정보 오류: {e}")
         return False
 
-    context = None
     try:
+        if context is not None:
+            if page is None:
+                page = context.pages[0] if context.pages else await context.new_page()
+            return await _login_flow(page)
+        if playwright is not None:
+            return await _run_full_auto_login(playwright, headless)
         async with async_playwright() as p:
-            try:
-                context = await p.chromium.launch_persistent_context(
-                    user_data_dir=str(BROWSER_PROFILE),
-                    headless=headless,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-infobars',
-                    ],
-                    viewport={'width': 1280, 'height': 900},
-                )
-            except PlaywrightError as e:
-                print(f"  ❌ 브라우저 시작 실패: {e}")
-                logger.error("Browser launch failed", exc_info=True)
-                return False
+            return await _run_full_auto_login(p, headless)
+    except Exception as e:
+        logger.error(f"Unexpected error during full_auto_login: {e}", exc_info=True)
+        print(f"  ❌ 예기치 않은 오류: {e}")
+        return False
 
-            page = context.pages[0] if context.pages else await context.new_page()
 
-            # Handle page crash gracefully
-            page.on("crash", lambda: logger.error("Page crashed during login"))
+async def _run_full_auto_login(p, headless: bool) -> bool:
+    """full_auto_login 본체 — 주어진 Playwright 드라이버로 로그인 수행"""
+    try:
+        context = await p.chromium.launch_persistent_context(
+            user_data_dir=str(BROWSER_PROFILE),
+            headless=headless,
+            args=_chromium_args(headless),
+            viewport={'width': 1280, 'height': 900},
+        )
+    except PlaywrightError as e:
+        print(f"  ❌ 브라우저 시작 실패: {e}")
+        logger.error("Browser launch failed", exc_info=True)
+        return False
 
-            # 1. NotebookLM 접속
-            print("\n[1/4] NotebookLM 접속...")
-            try:
-                await page.goto('https://notebooklm.google.com/', timeout=60000)
-                await asyncio.sleep(3)
-            except PlaywrightTimeoutError:
-                print("  ❌ NotebookLM 접속 타임아웃 (60초). 네트워크를 확인하세요.")
-                await _save_debug_screenshot(page, "login_step1_timeout")
-                await context.close()
-                return False
-            except PlaywrightError as e:
-                print(f"  ❌ NotebookLM 접속 실패: {e}")
-                await context.close()
-                return False
+    # 공유 드라이버를 쓰는 경우 예외가 나도 컨텍스트(브라우저)가 남지 않도록 정리
+    try:
+        await context.route("**/*", _route_login_request)
+        page = context.pages[0] if context.pages else await context.new_page()
 
-            # 이미 로그인된 경우
-            if 'notebooklm.google.com' in page.url and 'accounts' not in page.url:
-                print("  ✓ 이미 로그인되어 있습니다.")
-                await context.close()
-                return True
+        return await _login_flow(page, owned_context=context)
+    except Exception:
+        await context.close()
+        raise
 
-            # 계정 잠금 감지
-            page_text = await page.inner_text('body').call if False else ""
-            try:
-                page_text = await page.inner_text('body')
-            except PlaywrightError:
-                page_text = ""
 
-            if any(indicator.lower() in page_text.lower() for indicator in _LOCKOUT_INDICATORS):
-                print("  ❌ 계정 잠금 또는 비정상 활동 감지. Google 계정을 직접 확인하세요.")
-                await _save_debug_screenshot(page, "login_lockout_detected")
-                await context.close()
-                return False
+async def _login_flow(page, owned_context=None) -> bool:
+    """
+    로그인 단계 수행 (접속 → 이메일 → 비밀번호 → 2FA → 결과 확인)
 
-            # 2. 이메일 입력
-            if 'accounts.google.com' in page.url:
-                print("[2/4] 이메일 입력...")
-                try:
-                    await page.wait_for_selector('input[type="email"]', timeout=10000)
-                    await page.fill('input[type="email"]', EMAIL)
-                    await page.click('#identifierNext')
-                    await asyncio.sleep(4)
-                    print("  ✓ 이메일 입력 완료")
-                except PlaywrightTimeoutError:
-                    print("  ❌ 이메일 입력 필드를 찾을 수 없습니다 (타임아웃). 로그인 페이지 구조가 변경되었을 수 있습니다.")
-                    await _save_debug_screenshot(page, "login_step2_timeout")
-                    await context.close()
-                    return False
-                except PlaywrightError as e:
-                    print(f"  ❌ 이메일 입력 실패 (브라우저 오류): {e}")
-                    await _save_debug_screenshot(page, "login_step2_error")
-                    await context.close()
-                    return False
+    Args:
+        page: 로그인을 진행할 페이지
+        owned_context: 끝날 때 닫을 컨텍스트 (호출자에게 빌린 컨텍스트면 None — 닫지 않음)
+    """
+    # Handle page crash gracefully
+    page.on("crash", lambda: logger.error("Page crashed during login"))
 
-            # 3. 비밀번호 입력
-            print("[3/4] 비밀번호 입력...")
-            try:
-                await page.wait_for_selector('input[type="password"]', timeout=10000)
-                await page.fill('input[type="password"]', PASSWORD)
-                await page.click('#passwordNext')
-                await asyncio.sleep(4)
-                print("  ✓ 비밀번호 입력 완료")
-            except PlaywrightTimeoutError:
-                print("  ❌ 비밀번호 입력 필드를 찾을 수 없습니다 (타임아웃). 이메일 주소가 올바른지 확인하세요.")
-                await _save_debug_screenshot(page, "login_step3_timeout")
-                await context.close()
-                return False
-            except PlaywrightError as e:
-                print(f"  ❌ 비밀번호 입력 실패 (브라우저 오류): {e}")
-                await _save_debug_screenshot(page, "login_step3_error")
-                await context.close()
-                return False
+    # 1. NotebookLM 접속
+    print("\n[1/4] NotebookLM 접속...")
+    try:
+        await _open_notebooklm(page)
+    except PlaywrightTimeoutError:
+        print("  ❌ NotebookLM 접속 타임아웃 (60초). 네트워크를 확인하세요.")
+        await _close_with_screenshot(owned_context, page, "login_step1_timeout")
+        return False
+    except PlaywrightError as e:
+        print(f"  ❌ NotebookLM 접속 실패: {e}")
+        await _close_if_owned(owned_context)
+        return False
 
-            # 비밀번호 오류 감지 (잘못된 비밀번호)
-            await asyncio.sleep(1)
-            try:
-                wrong_pw_indicators = [
-                    '[jsname="B34EJ"]:visible',  # Google 오류 메시지 컨테이너
-                    '[aria-live="assertive"]:visible',
-                ]
-                for sel in wrong_pw_indicators:
-                    err_elem = await page.query_selector(sel)
-                    if err_elem:
-                        err_text = await err_elem.inner_text()
-                        if err_text.strip():
-                            print(f"  ❌ Google 로그인 오류: {err_text.strip()[:100]}")
-                            await _save_debug_screenshot(page, "login_wrong_password")
-                            await context.close()
-                            return False
-            except PlaywrightError:
-                pass
-
-            # 4. 2FA TOTP 입력 (최대 2회 재시도)
-            print("[4/4] 2FA 코드 입력...")
-            totp_success = await _handle_totp(page)
-            if not totp_success:
-                # 2FA 실패해도 로그인 성공일 수 있으므로 계속 진행
-                logger.warning("TOTP step did not confirm success; checking login state anyway")
-
-            # 로그인 결과 확인
-            print("\n로그인 결과 확인...")
-            for i in range(10):
-                await asyncio.sleep(2)
-                if 'notebooklm.google.com' in page.url and 'accounts' not in page.url:
-                    print("✓ 로그인 성공!")
-                    await context.close()
-                    return True
-                print(f"  대기 중... {(i+1)*2}초")
-
-            print("❌ 로그인 실패")
-            await _save_debug_screenshot(page, "login_failed")
-            await context.close()
+    # 이미 로그인된 경우
+    if 'notebooklm.google.com' in page.url and 'accounts' not in page.url:
+        print("  ✓ 이미 로그인되어 있습니다.")
+        await _close_if_owned(owned_context)
+        return True
+
+    # 계정 잠금 감지
+    try:
+        page_text = await page.inner_text('body')
+    except PlaywrightError:
+        page_text = ""
+
+    if _LOCKOUT_RE.search(page_text):
+        print("  ❌ 계정 잠금 또는 비정상 활동 감지. Google 계정을 직접 확인하세요.")
+        await _close_with_screenshot(owned_context, page, "login_lockout_detected")
+        return False
+
+    # 2. 이메일 입력
+    if 'accounts.google.com' in page.url:
+        print("[2/4] 이메일 입력...")
+        try:
+            await page.wait_for_selector('input[type="email"]', timeout=10000)
+            await page.fill('input[type="email"]', _email())
+            await page.click('#identifierNext')
+            print("  ✓ 이메일 입력 완료")
+        except PlaywrightTimeoutError:
+            print("  ❌ 이메일 입력 필드를 찾을 수 없습니다 (타임아웃). 로그인 페이지 구조가 변경되었을 수 있습니다.")
+            await _close_with_screenshot(owned_context, page, "login_step2_timeout")
+            return False
+        except PlaywrightError as e:
+            print(f"  ❌ 이메일 입력 실패 (브라우저 오류): {e}")
+            await _close_with_screenshot(owned_context, page, "login_step2_error")
             return False
 
-    except Exception as e:
-        logger.error(f"Unexpected error during full_auto_login: {e}", exc_info=True)
-        print(f"  ❌ 예기치 않은 오류: {e}")
+    # 3. 비밀번호 입력
+    print("[3/4] 비밀번호 입력...")
+    try:
+        await page.wait_for_selector('input[type="password"]', timeout=10000)
+        await page.fill('input[type="password"]', _password())
+        await page.click('#passwordNext')
+        await _wait_until(page, _PASSWORD_SUBMITTED_JS, 5000)
+        print("  ✓ 비밀번호 입력 완료")
+    except PlaywrightTimeoutError:
+        print("  ❌ 비밀번호 입력 필드를 찾을 수 없습니다 (타임아웃). 이메일 주소가 올바른지 확인하세요.")
+        await _close_with_screenshot(owned_context, page, "login_step3_timeout")
+        return False
+    except PlaywrightError as e:
+        print(f"  ❌ 비밀번호 입력 실패 (브라우저 오류): {e}")
+        await _close_with_screenshot(owned_context, page, "login_step3_error")
         return False
 
+    # 비밀번호 오류 감지 (잘못된 비밀번호)
+    err_text = await _login_error_text(page)
+    if err_text:
+        print(f"  ❌ Google 로그인 오류: {err_text[:100]}")
+        await _close_with_screenshot(owned_context, page, "login_wrong_password")
+        return False
+
+    # 4. 2FA TOTP 입력 (최대 2회 재시도)
+    print("[4/4] 2FA 코드 입력...")
+    totp_success = await _handle_totp(page)
+    if not totp_success:
+        # 2FA 실패해도 로그인 성공일 수 있으므로 계속 진행
+        logger.warning("TOTP step did not confirm success; checking login state anyway")
+
+    # 로그인 결과 확인
+    print("\n로그인 결과 확인...")
+    try:
+        await page.wait_for_url(
+            lambda url: 'notebooklm.google.com' in url and 'accounts' not in url,
+            timeout=20000,
+            wait_until='commit',
+        )
+        print("✓ 로그인 성공!")
+        await _close_if_owned(owned_context)
+        return True
+    except PlaywrightTimeoutError:
+        pass
+
+    print("❌ 로그인 실패")
+    await _close_with_screenshot(owned_context, page, "login_failed")
+    return False
+
+
+async def _route_login_request(route) -> None:
+    """context.route 핸들러 — 로그인에 필요 없는 폰트/미디어/추적 요청 차단"""
+    request = route.request
+    if (request.resource_type in _LOGIN_BLOCKED_RESOURCE_TYPES
+            or any(marker in request.url for marker in _LOGIN_BLOCKED_URL_MARKERS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _any_of(page, selectors):
+    """selectors 중 먼저 나타나는 요소의 Locator (OR 조합 — 대기 시간이 후보 수만큼 누적되지 않음)"""
+    locator = page.locator(selectors[0])
+    for sel in selectors[1:]:
+        locator = locator.or_(page.locator(sel))
+    return locator.first
+
+
+async def _settle(page, timeout_ms: int) -> None:
+    """네트워크가 잠잠해질 때까지 대기 (최대 timeout_ms — 고정 sleep 대신, 준비되면 바로 진행)"""
+    try:
+        await page.wait_for_load_state('networkidle', timeout=timeout_ms)
+    except PlaywrightError:
+        pass
+
+
+async def _wait_until(page, js: str, timeout_ms: int) -> bool:
+    """
+    JS 조건이 참이 될 때까지 대기 — 충족 여부 반환
+    (시간 초과/페이지 전환은 무시 — 다음 단계에서 상태를 다시 확인)
+    """
+    try:
+        await page.wait_for_function(js, timeout=timeout_ms)
+        return True
+    except PlaywrightError:
+        return False
+
+
+async def _open_notebooklm(page) -> None:
+    """
+    NotebookLM 접속 — load 이벤트(분석 스크립트/폰트 등) 대신 DOM 준비 후
+    로그인 필드 또는 NotebookLM 도착을 기다림. 둘 다 안 보이면 networkidle로 폴백.
+    """
+    await page.goto('https://notebooklm.google.com/', wait_until='domcontentloaded', timeout=60000)
+    if not await _wait_until(page, _LOGIN_PAGE_READY_JS, 5000):
+        await _settle(page, 3000)
+
 
 async def _save_debug_screenshot(page, name: str) -> None:
     """오류 디버깅용 스크린샷 저장"""
@@ -252,6 +452,58 @@ async def _save_debug_screenshot(page, name: str) -> None:
         logger.warning(f"Screenshot failed for '{name}': {e}")
 
 
+async def _close_if_owned(context) -> None:
+    """_login_flow가 소유한 컨텍스트만 닫음 (None이면 호출자 소유 — 그대로 둠)"""
+    if context is not None:
+        await context.close()
+
+
+async def _close_with_screenshot(context, page, name: str) -> None:
+    """
+    오류 스크린샷을 남기고 컨텍스트 종료 (context가 None이면 스크린샷만)
+
+    캡처는 페이지가 살아 있을 때 먼저 하고, PNG 파일 쓰기와 브라우저 종료는 동시에 진행.
+    """
+    path = f"{name}_{int(time.time())}.png"
+    try:
+        png = await page.screenshot()
+    except PlaywrightError as e:
+        logger.warning(f"Screenshot failed for '{name}': {e}")
+        png = None
+
+    if png is None:
+        await _close_if_owned(context)
+        return
+
+    written, closed = await asyncio.gather(
+        asyncio.to_thread(Path(path).write_bytes, png),
+        _close_if_owned(context),
+        return_exceptions=True,
+    )
+    if isinstance(written, Exception):
+        logger.warning(f"Screenshot write failed for '{name}': {written}")
+    else:
+        print(f"  스크린샷 저장: {path}")
+    if isinstance(closed, Exception):
+        raise closed
+
+
+async def _login_error_text(page) -> str:
+    """화면에 보이는 Google 로그인 오류 메시지 (없으면 빈 문자열)"""
+    try:
+        return await page.evaluate(_LOGIN_ERROR_TEXT_JS)
+    except PlaywrightError:
+        return ""
+
+
+async def _first_present_selector(page, selectors) -> Optional[str]:
+    """selectors 중 페이지에 있는 첫 번째 셀렉터 (CDP 왕복 1회)"""
+    try:
+        return await page.evaluate(_FIRST_PRESENT_JS, list(selectors))
+    except PlaywrightError:
+        return None
+
+
 async def _handle_totp(page, max_attempts: int = 2) -> bool:
     """
     TOTP 2FA 처리 (재시도 포함)
@@ -264,58 +516,47 @@ async def _handle_totp(page, max_attempts: int = 2) -> bool:
         TOTP 입력 성공 여부
     """
     try:
-        await asyncio.sleep(2)
+        await _wait_until(page, _TOTP_SCREEN_READY_JS, 5000)
 
         # 먼저 TOTP 입력 필드가 있는지 확인
-        totp_input = await page.query_selector(
-            'input[name="totpPin"], input[type="tel"][autocomplete="one-time-code"], input[id="totpPin"]'
-        )
+        totp_input = await page.query_selector(_TOTP_INPUT_SELECTOR)
 
         # TOTP 필드가 없으면 "다른 방법 시도" 클릭
         if not totp_input:
             print("  Push 알림 방식 감지, OTP 방식으로 전환...")
 
-            # "다른 방법 시도" 클릭
+            # "다른 방법 시도" 클릭 — 있는 셀렉터를 먼저 확인한 뒤 그것만 클릭
+            # 아직 렌더링 전이면 후보 전체의 OR 로케이터로 한 번만 대기
             switched = False
-            for text_selector in ['text=다른 방법 시도', 'text=Try another way']:
-                try:
+            text_selector = await _first_present_selector(page, _TRY_ANOTHER_WAY_SELECTORS)
+            try:
+                if text_selector:
                     await page.click(text_selector, timeout=5000)
-                    await asyncio.sleep(2)
-                    print(f"  ✓ 다른 방법 시도 클릭 ({text_selector})")
-                    switched = True
-                    break
-                except PlaywrightTimeoutError:
-                    continue
-                except PlaywrightError as e:
-                    logger.debug(f"Try another way click failed ({text_selector}): {e}")
+                else:
+                    await _any_of(page, _TRY_ANOTHER_WAY_SELECTORS).click(timeout=5000)
+                await _settle(page, 2000)
+                print(f"  ✓ 다른 방법 시도 클릭 ({text_selector or '대기 후 발견'})")
+                switched = True
+            except PlaywrightError as e:
+                logger.debug(f"Try another way click failed ({text_selector}): {e}")
 
             if not switched:
                 logger.warning("Could not click 'Try another way'; proceeding anyway")
 
-            # OTP/Authenticator 앱 옵션 선택
-            otp_options = [
-                'text=Google OTP',
-                'text=Authenticator',
-                'text=인증 앱',
-                'text=OTP 앱',
-                '[data-challengetype="6"]',
-                '[data-challengetype="5"]',
-            ]
-            for selector in otp_options:
-                try:
-                    await page.click(selector, timeout=2000)
-                    print(f"  ✓ OTP 방식 선택: {selector}")
-                    await asyncio.sleep(3)
-                    break
-                except (PlaywrightTimeoutError, PlaywrightError):
-                    continue
+            # OTP/Authenticator 앱 옵션 선택 — 같은 방식 (확인된 셀렉터 또는 OR 로케이터)
+            option = await _first_present_selector(page, _OTP_OPTION_SELECTORS)
+            try:
+                if option:
+                    await page.click(option, timeout=2000)
+                else:
+                    await _any_of(page, _OTP_OPTION_SELECTORS).click(timeout=5000)
+                print(f"  ✓ OTP 방식 선택: {option or '대기 후 발견'}")
+            except PlaywrightError as e:
+                logger.debug(f"OTP option click failed ({option}): {e}")
 
             # 다시 TOTP 필드 찾기
             try:
-                totp_input = await page.wait_for_selector(
-                    'input[name="totpPin"], input[type="tel"], input[id="totpPin"], input[autocomplete="one-time-code"]',
-                    timeout=10000
-                )
+                totp_input = await page.wait_for_selector(_TOTP_INPUT_ANY_SELECTOR, timeout=10000)
             except PlaywrightTimeoutError:
                 print("  ⚠️ TOTP 입력 필드를 찾을 수 없습니다 (10초 타임아웃)")
                 await _save_debug_screenshot(page, "login_totp_field_missing")
@@ -329,11 +570,10 @@ async def _handle_totp(page, max_attempts: int = 2) -> bool:
         for attempt in range(1, max_attempts + 1):
             try:
                 # TOTP 코드가 곧 만료되면 다음 코드로 갱신 (타이밍 경쟁 조건 방지)
-                remaining = 30 - (int(time.time()) % 30)
-                if remaining <= 3:
-                    print(f"  ⏳ TOTP 코드 갱신 대기 ({remaining}초)...")
-                    await asyncio.sleep(remaining + 1)
-                code = get_totp_code()
+                code, wait = _fresh_totp_code()
+                if wait:
+                    print(f"  ⏳ TOTP 코드 갱신 대기 ({wait - 1}초)...")
+                    await asyncio.sleep(wait)
                 print(f"  생성된 코드: {code} (시도 {attempt}/{max_attempts})")
             except RuntimeError as e:
                 print(f"  ❌ TOTP 코드 생성 실패: {e}")
@@ -341,50 +581,37 @@ async def _handle_totp(page, max_attempts: int = 2) -> bool:
 
             try:
                 await totp_input.fill(code)
-                await asyncio.sleep(1)
             except PlaywrightError as e:
                 print(f"  ❌ TOTP 코드 입력 실패 (브라우저 오류): {e}")
                 return False
 
             # 다음 버튼 클릭
-            next_btn = await page.query_selector(
-                '#totpNext, button:has-text("다음"), button:has-text("Next")'
-            )
+            next_btn = await page.query_selector(_TOTP_NEXT_SELECTOR)
             if next_btn:
                 try:
                     await next_btn.click()
-                    await asyncio.sleep(5)
                 except PlaywrightError as e:
                     print(f"  ❌ 다음 버튼 클릭 실패: {e}")
                     return False
 
-            # 오류 메시지 확인 (잘못된 OTP)
-            await asyncio.sleep(1)
-            try:
-                otp_error = await page.query_selector(
-                    '[jsname="B34EJ"]:visible, [aria-live="assertive"]:visible'
-                )
-                if otp_error:
-                    err_text = await otp_error.inner_text()
-                    if err_text.strip() and attempt < max_attempts:
-                        print(f"  ⚠️ OTP 오류: {err_text.strip()[:80]}. 재시도 중...")
-                        await asyncio.sleep(2)
-                        # 필드를 다시 찾아서 재입력
-                        try:
-                            totp_input = await page.wait_for_selector(
-                                'input[name="totpPin"], input[type="tel"], input[id="totpPin"]',
-                                timeout=5000
-                            )
-                        except PlaywrightTimeoutError:
-                            print("  ❌ 재입력 필드를 찾을 수 없습니다")
-                            return False
-                        continue
-                    elif err_text.strip():
-                        print(f"  ❌ OTP 최대 시도 초과: {err_text.strip()[:80]}")
-                        await _save_debug_screenshot(page, "login_totp_failed")
-                        return False
-            except PlaywrightError:
-                pass
+            # 오류 메시지 확인 (잘못된 OTP) — 화면 전환 또는 오류 표시까지 대기
+            await _wait_until(page, _TOTP_SUBMITTED_JS, 6000)
+            err_text = await _login_error_text(page)
+            if err_text and attempt < max_attempts:
+                print(f"  ⚠️ OTP 오류: {err_text[:80]}. 재시도 중...")
+                # 필드를 다시 찾아서 재입력
+                try:
+                    totp_input = await page.wait_for_selector(
+                        _TOTP_INPUT_RETRY_SELECTOR, timeout=5000
+                    )
+                except PlaywrightTimeoutError:
+                    print("  ❌ 재입력 필드를 찾을 수 없습니다")
+                    return False
+                continue
+            elif err_text:
+                print(f"  ❌ OTP 최대 시도 초과: {err_text[:80]}")
+                await _save_debug_screenshot(page, "login_totp_failed")
+                return False
 
             print("  ✓ 2FA 코드 입력 완료")
             return True
@@ -409,7 +636,7 @@ async def login_and_get_context():
             context = await p.chromium.launch_persistent_context(
                 user_data_dir=str(BROWSER_PROFILE),
                 headless=False,
-                args=['--disable-blink-features=AutomationControlled'],
+                args=_chromium_args(headless=False),
                 viewport={'width': 1280, 'height': 900},
             )
         except PlaywrightError as e:
@@ -417,11 +644,12 @@ async def login_and_get_context():
             logger.error("Browser launch failed in login_and_get_context", exc_info=True)
             return None, None
 
+        # 로그인 동안만 불필요한 요청 차단 (반환 전에 해제 — 호출자 작업에는 영향 없음)
+        await context.route("**/*", _route_login_request)
         page = context.pages[0] if context.pages else await context.new_page()
 
         try:
-            await page.goto('https://notebooklm.google.com/', timeout=60000)
-            await asyncio.sleep(3)
+            await _open_notebooklm(page)
         except PlaywrightTimeoutError:
             print("  ❌ NotebookLM 접속 타임아웃. 네트워크를 확인하세요.")
             await context.close()
@@ -431,35 +659,15 @@ async def login_and_get_context():
             await context.close()
             return None, None
 
-        # 로그인 필요시
+        # 로그인 필요시 — 같은 컨텍스트/페이지에서 바로 로그인 (브라우저 재시작 없음)
+        # 성공하면 페이지는 이미 NotebookLM에 있음
         if 'accounts.google.com' in page.url:
-            success = await full_auto_login(headless=False)
+            success = await full_auto_login(headless=False, context=context, page=page)
             if not success:
                 await context.close()
                 return None, None
 
-            # 다시 컨텍스트 열기
-            try:
-                await context.close()
-                context = await p.chromium.launch_persistent_context(
-                    user_data_dir=str(BROWSER_PROFILE),
-                    headless=False,
-                    args=['--disable-blink-features=AutomationControlled'],
-                    viewport={'width': 1280, 'height': 900},
-                )
-            except PlaywrightError as e:
-                print(f"  ❌ 브라우저 재시작 실패: {e}")
-                return None, None
-
-            page = context.pages[0] if context.pages else await context.new_page()
-            try:
-                await page.goto('https://notebooklm.google.com/', timeout=60000)
-                await asyncio.sleep(3)
-            except PlaywrightTimeoutError:
-                print("  ❌ 재접속 타임아웃")
-                await context.close()
-                return None, None
-
+        await context.unroute("**/*", _route_login_request)
         return context, page
 
 
@@ -10,18 +10,70 @@ import logging
 import json
 import sys
 import time
-import re
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 
-if sys.platform == 'win32':
+if sys.platform == 'win32' and sys.stdout.encoding.lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
 from .config import get_config
 
 logger = logging.getLogger(__name__)
 
+# 노트북 페이지 로드 완료 판단용 — 소스 패널/스튜디오 패널 중 하나라도 붙으면 준비됨
+_NOTEBOOK_READY_SELECTOR = (
+    'button:has-text("소스 추가"), '
+    'button:has-text("Add source"), '
+    '[aria-label*="Add source"], '
+    '[aria-label*="Studio"], '
+    'button:has-text("Studio")'
+)
+
+# 자동화에 불필요한 리소스 — NotebookLM 탐색 시 중단 (스타일시트는 가시성 판정에 필요해 유지)
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_BLOCKED_URL_MARKERS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net")
+
+# wait_for_slides: 노트북은 한 번만 열고 같은 페이지에서 폴링, N회마다 재탐색으로 UI 갱신
+_SLIDES_RENAVIGATE_EVERY = 6
+
+# check_slides_ready의 DOM probe (순서/의미는 기존 query_selector 체인과 동일):
+#   1) 로딩 인디케이터 중 첫 매치가 보이면 → 아직 생성 중 (false)
+#   2) 다운로드/더보기 버튼 중 첫 매치가 보이면 → 완료 (true)
+#   3) 슬라이드 미리보기가 있으면 → 완료 (true)
+# button:has-text("...")는 Playwright 전용 문법이라 textContent 포함 여부로 재현
+_SLIDES_READY_JS = """() => {
+    const visible = (el) => {
+        if (!el) return false;
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0
+            && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const buttonWithText = (text) => Array.from(document.querySelectorAll('button'))
+        .find((b) => (b.textContent || '').toLowerCase().includes(text.toLowerCase()));
+
+    const loading = ['[class*="loading"]', '[class*="spinner"]',
+                     '[class*="progress"]', '[aria-busy="true"]'];
+    for (const sel of loading) {
+        if (visible(document.querySelector(sel))) return false;
+    }
+
+    const downloads = [
+        () => buttonWithText('다운로드'),
+        () => buttonWithText('Download'),
+        () => document.querySelector('[aria-label*="download"]'),
+        () => document.querySelector('[aria-label*="Download"]'),
+        () => document.querySelector('button[aria-label*="더보기"]'),
+    ];
+    for (const find of downloads) {
+        if (visible(find())) return true;
+    }
+
+    const previews = ['[class*="slide-preview"]', '[class*="presentation-preview"]',
+                      'img[alt*="slide"]', '[data-slide-index]'];
+    return previews.some((sel) => document.querySelector(sel) !== null);
+}"""
+
 
 class NotebookLMBrowser:
     """
@@ -72,6 +124,24 @@ class NotebookLMBrowser:
 
         # 페이지 크래시 이벤트 등록
         self.page.on("crash", lambda: logger.error("NotebookLMBrowser: page crashed"))
+        await self._install_resource_blocking()
+
+    async def _install_resource_blocking(self):
+        """이미지/폰트/미디어/분석 스크립트 요청 차단 (browser_block_resources 설정 시)"""
+        if self.config.browser_block_resources:
+            await self.context.route("**/*", self._route_request)
+
+    async def _route_request(self, route):
+        """context.route 핸들러 — 로그인 페이지(캡차 등)는 리소스를 그대로 통과"""
+        request = route.request
+        url = request.url
+        if any(marker in url for marker in _BLOCKED_URL_MARKERS):
+            await route.abort()
+        elif (request.resource_type in _BLOCKED_RESOURCE_TYPES
+              and 'accounts.google' not in self.page.url):
+            await route.abort()
+        else:
+            await route.continue_()
 
     async def close(self):
         """브라우저 종료 (항상 정리 보장)"""
@@ -99,7 +169,6 @@ class NotebookLMBrowser:
         from playwright.async_api import (
             TimeoutError as PlaywrightTimeoutError,
             Error as PlaywrightError,
-            async_playwright,
         )
 
         try:
@@ -120,13 +189,18 @@ class NotebookLMBrowser:
             # 완전 자동 로그인 시도 (TOTP 포함)
             try:
                 from .auto_login import full_auto_login, BROWSER_PROFILE
-                success = await full_auto_login(headless=self.config.browser_headless)
+                # 이미 띄운 Playwright 드라이버를 로그인에도 재사용
+                success = await full_auto_login(
+                    headless=self.config.browser_headless, playwright=self.playwright
+                )
 
                 if success:
-                    # 자동 로그인 성공 후 브라우저 재시작
-                    await self.close()
+                    # 자동 로그인 성공 후 컨텍스트만 재시작 (드라이버 유지)
+                    try:
+                        await self.context.close()
+                    except PlaywrightError as e:
+                        logger.warning(f"Context close error (ignored): {e}")
                     try:
-                        self.playwright = await async_playwright().start()
                         self.context = await self.playwright.chromium.launch_persistent_context(
                             user_data_dir=str(BROWSER_PROFILE),
                             headless=self._headless,
@@ -140,13 +214,14 @@ class NotebookLMBrowser:
                         )
                         self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
                         self.page.on("crash", lambda: logger.error("Page crashed after re-login"))
+                        await self._install_resource_blocking()
                     except PlaywrightError as e:
                         print(f"  ❌ 로그인 후 브라우저 재시작 실패: {e}")
                         logger.error("Browser restart after login failed", exc_info=True)
                         return False
 
                     try:
-                        await self.page.goto(self.base_url, timeout=30000)
+                        await self.page.goto(self.base_url, wait_until='domcontentloaded', timeout=30000)
                         await asyncio.sleep(3)
                         return True
                     except PlaywrightTimeoutError:
@@ -334,10 +409,19 @@ class NotebookLMBrowser:
         return None
 
     async def open_notebook(self, notebook_id: str):
-        """노트북 열기"""
+        """노트북 열기 (노트북 UI가 붙으면 바로 반환, 최대 5초 대기)"""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
         url = f"{self.base_url}/notebook/{notebook_id}"
         await self.page.goto(url, wait_until='domcontentloaded', timeout=30000)
-        await asyncio.sleep(5)
+        # 고정 5초 대기 대신 소스/스튜디오 패널이 DOM에 붙는 즉시 진행
+        try:
+            await self.page.wait_for_selector(
+                _NOTEBOOK_READY_SELECTOR, state='attached', timeout=5000
+            )
+        except PlaywrightTimeoutError:
+            # 셀렉터가 바뀐 경우에도 기존처럼 5초 후 계속 진행
+            logger.debug("open_notebook: ready selector not found within 5s: %s", notebook_id)
 
     async def delete_notebook(self, notebook_id: str) -> bool:
         """노트북 삭제"""
@@ -659,51 +743,9 @@ class NotebookLMBrowser:
             await self.open_notebook(notebook_id)
             await asyncio.sleep(2)
 
-        # 로딩/생성 중 인디케이터 확인
-        loading_indicators = [
-            '[class*="loading"]',
-            '[class*="spinner"]',
-            '[class*="progress"]',
-            '[aria-busy="true"]',
-        ]
-
-        for sel in loading_indicators:
-            loading = await self.page.query_selector(sel)
-            if loading:
-                is_visible = await loading.is_visible()
-                if is_visible:
-                    return False  # 아직 생성 중
-
-        # 다운로드 버튼이 있으면 완료
-        download_selectors = [
-            'button:has-text("다운로드")',
-            'button:has-text("Download")',
-            '[aria-label*="download"]',
-            '[aria-label*="Download"]',
-            'button[aria-label*="더보기"]',  # more menu button
-        ]
-
-        for sel in download_selectors:
-            download_btn = await self.page.query_selector(sel)
-            if download_btn:
-                is_visible = await download_btn.is_visible()
-                if is_visible:
-                    return True
-
-        # 슬라이드 미리보기가 보이면 완료
-        preview_selectors = [
-            '[class*="slide-preview"]',
-            '[class*="presentation-preview"]',
-            'img[alt*="slide"]',
-            '[data-slide-index]',
-        ]
-
-        for sel in preview_selectors:
-            preview = await self.page.query_selector(sel)
-            if preview:
-                return True
-
-        return False
+        # PERF: 로딩 인디케이터 / 다운로드 버튼 / 미리보기 probe 13개를 브라우저 안에서
+        # 한 번에 평가 — query_selector·is_visible 왕복(최대 20여 회)을 1회로
+        return await self.page.evaluate(_SLIDES_READY_JS)
 
     async def get_slide_status(self, notebook_id: str = None) -> Tuple[bool, str]:
         """
@@ -743,9 +785,13 @@ class NotebookLMBrowser:
         """슬라이드 생성 완료 대기"""
         max_wait = timeout or self.config.timeout_slides
         start = time.time()
+        poll_count = 0
 
         while time.time() - start < max_wait:
-            ready, status = await self.get_slide_status(notebook_id)
+            # 매 폴링마다 goto(+2초 대기)하지 않고 열린 페이지를 재사용
+            renavigate = poll_count % _SLIDES_RENAVIGATE_EVERY == 0
+            ready, status = await self.get_slide_status(notebook_id if renavigate else None)
+            poll_count += 1
 
             if ready:
                 print(f"  ✓ 슬라이드 생성 완료")
@@ -755,7 +801,11 @@ class NotebookLMBrowser:
                 return False
 
             elapsed = int(time.time() - start)
-            print(f"\r  생성 중... {elapsed}초", end="", flush=True)
+            if sys.stdout.isatty():
+                print(f"\r  생성 중... {elapsed}초", end="", flush=True)
+            elif renavigate:
+                # 로그 파일에는 재탐색 주기(약 1분)마다 한 줄만
+                print(f"  생성 중... {elapsed}초")
             await asyncio.sleep(10)
 
         print(f"\n  ⏰ 타임아웃 ({max_wait}초)")
@@ -18,7 +18,7 @@ import sys
 from pathlib import Path
 from typing import List
 
-if sys.platform == 'win32':
+if sys.platform == 'win32' and sys.stdout.encoding.lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
 logger = logging.getLogger(__name__)
@@ -193,12 +193,14 @@ def cmd_list() -> None:
         print("노트북이 없습니다.")
         return
 
-    print(f"\n노트북 목록 ({len(notebooks)}개):")
-    print("-" * 60)
+    # 노트북당 print 3회 대신 전체 목록을 모아 한 번에 출력
+    separator = "-" * 60
+    lines = [f"\n노트북 목록 ({len(notebooks)}개):", separator]
     for nb in notebooks:
-        print(f"  ID: {nb.get('id', 'N/A')[:20]}...")
-        print(f"  제목: {nb.get('title', 'N/A')}")
-        print("-" * 60)
+        lines.append(f"  ID: {nb.get('id', 'N/A')[:20]}...")
+        lines.append(f"  제목: {nb.get('title', 'N/A')}")
+        lines.append(separator)
+    print("\n".join(lines))
 
 
 def cmd_delete(args: argparse.Namespace) -> None:
@@ -14,7 +14,7 @@ from pathlib import Path
 from dataclasses import dataclass, field, asdict
 from typing import Optional, Dict, Any, List
 
-if sys.platform == 'win32':
+if sys.platform == 'win32' and sys.stdout.encoding.lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
 logger = logging.getLogger(__name__)
@@ -109,6 +109,8 @@ class NoterangConfig:
         browser_headless: Whether to run the browser in headless mode.
         browser_viewport_width: Browser viewport width in pixels.
         browser_viewport_height: Browser viewport height in pixels.
+        browser_block_resources: Abort image/font/media and analytics requests in
+            :class:`~noterang.browser.NotebookLMBrowser` to speed up navigation.
         default_language: BCP-47 language code for generated slides (default ``"ko"``).
         debug: Enable verbose debug output.
         save_screenshots: Persist browser screenshots for diagnostics.
@@ -132,6 +134,7 @@ class NoterangConfig:
     browser_headless: bool = False
     browser_viewport_width: int = DEFAULT_VIEWPORT_WIDTH
     browser_viewport_height: int = DEFAULT_VIEWPORT_HEIGHT
+    browser_block_resources: bool = True
 
     default_language: str = DEFAULT_LANGUAGE
 
@@ -17,7 +17,7 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-if sys.platform == 'win32':
+if sys.platform == 'win32' and sys.stdout.encoding.lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
 
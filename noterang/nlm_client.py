@@ -12,7 +12,7 @@ import sys
 import time
 import logging
 
-if sys.platform == 'win32':
+if sys.platform == 'win32' and sys.stdout.encoding.lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
 logger = logging.getLogger(__name__)
@@ -13,7 +13,7 @@ import sys
 import time
 from typing import Optional, List, Dict, Tuple
 
-if sys.platform == 'win32':
+if sys.platform == 'win32' and sys.stdout.encoding.lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
 from .nlm_client import get_nlm_client, NLMClientError, NLMAuthError
@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Optional, List, Dict
 
 # Set UTF-8 encoding for Windows
-if sys.platform == 'win32':
+if sys.platform == 'win32' and sys.stdout.encoding.lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
 class NoterangAgent:
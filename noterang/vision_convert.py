@@ -16,7 +16,7 @@ from pathlib import Path
 from typing import List, Tuple, Optional
 from dataclasses import dataclass, field
 
-if sys.platform == 'win32':
+if sys.platform == 'win32' and sys.stdout.encoding.lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
 from dotenv import load_dotenv
@@ -131,6 +131,20 @@ class TestCreateInfographic:
 
         assert result == "pending"
 
+    def test_returns_id_from_json_stdout(self, mock_run_nlm):
+        mock_run_nlm.return_value = (
+            True,
+            'Infographic generation started\n{"id": "info-789", "status": "in_progress"}',
+            "",
+        )
+
+        with patch("noterang.artifacts.get_config") as mock_cfg:
+            mock_cfg.return_value.default_language = "ko"
+            from noterang.artifacts import create_infographic
+            result = create_infographic("nb-id-12345678")
+
+        assert result == "info-789"
+
     def test_returns_none_on_failure(self, mock_run_nlm):
         mock_run_nlm.return_value = (False, "", "error")
 
@@ -158,6 +172,15 @@ class TestCreateInfographic:
 # Tests: check_studio_status
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def clear_status_cache():
+    """check_studio_status 단기 캐시가 테스트 사이에 새지 않도록 비움"""
+    from noterang.artifacts import _status_cache
+    _status_cache.clear()
+    yield
+    _status_cache.clear()
+
+
 class TestCheckStudioStatus:
 
     def test_returns_completed_from_python_api(self, mock_nlm_client):
@@ -170,6 +193,17 @@ class TestCheckStudioStatus:
         assert status == "completed"
         assert data["status"] == "completed"
 
+    def test_repeated_calls_within_ttl_reuse_result(self, mock_nlm_client):
+        mock_nlm_client.poll_studio_status.return_value = [{"status": "in_progress"}]
+
+        with patch("noterang.artifacts.get_nlm_client", return_value=mock_nlm_client):
+            from noterang.artifacts import check_studio_status, is_generation_complete
+            status, _ = check_studio_status("nb-id-12345678")
+            assert is_generation_complete("nb-id-12345678") is False
+
+        assert status == "in_progress"
+        mock_nlm_client.poll_studio_status.assert_called_once()
+
     def test_returns_in_progress_when_empty_list(self, mock_nlm_client):
         mock_nlm_client.poll_studio_status.return_value = []
 
@@ -210,6 +244,18 @@ class TestCheckStudioStatus:
 
         assert status == "failed"
 
+    def test_cli_fallback_text_status_priority(self, mock_nlm_client):
+        mock_nlm_client.poll_studio_status.side_effect = Exception("error")
+        stdout = "slides: failed\ninfographic: In_Progress\naudio: completed"
+
+        with patch("noterang.artifacts.get_nlm_client", return_value=mock_nlm_client), \
+             patch("noterang.artifacts.run_nlm", return_value=(True, stdout, "")):
+            from noterang.artifacts import check_studio_status
+            status, data = check_studio_status("nb-id-12345678")
+
+        assert status == "completed"
+        assert data == {"raw": stdout}
+
     def test_cli_fallback_returns_unknown_on_cli_failure(self, mock_nlm_client):
         mock_nlm_client.poll_studio_status.side_effect = Exception("error")
 
@@ -321,6 +367,24 @@ class TestWaitForCompletion:
 
         assert call_count >= 1
 
+    @pytest.mark.asyncio
+    async def test_poll_interval_backs_off_up_to_check_interval(self, mock_nlm_client):
+        mock_nlm_client.poll_studio_status.side_effect = (
+            [[{"status": "in_progress"}]] * 5 + [[{"status": "completed"}]]
+        )
+        sleep_mock = AsyncMock()
+
+        # sleep을 모킹하므로 실제 시간이 흐르지 않음 — 상태 캐시 비활성화
+        with patch("noterang.artifacts.get_nlm_client", return_value=mock_nlm_client), \
+             patch("noterang.artifacts._STATUS_CACHE_TTL", 0), \
+             patch("asyncio.sleep", new=sleep_mock):
+            from noterang.artifacts import wait_for_completion
+            result = await wait_for_completion("nb-id-12345678", timeout=600, check_interval=5)
+
+        assert result is True
+        intervals = [c.args[0] for c in sleep_mock.await_args_list]
+        assert intervals == [2.0, 3.0, 4.5, 5, 5]
+
 
 # ---------------------------------------------------------------------------
 # Tests: create_slides_and_wait (async)
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for noterang/auth.py
+
+Tests:
+  - _summarize_google_cookies()
+  - _wait_for_notebooklm() (async)
+  - sync_to_profile()
+  - run_nlm()
+  - arun_nlm() (async)
+  - ensure_auth() (async)
+"""
+import asyncio
+import json
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+# ---------------------------------------------------------------------------
+# Tests: _summarize_google_cookies
+# ---------------------------------------------------------------------------
+
+class TestSummarizeGoogleCookies:
+
+    def test_collects_google_cookies_and_session_flags(self):
+        from noterang.auth import _summarize_google_cookies
+
+        cookies = [
+            {"name": "SID", "value": "sid", "domain": ".google.com"},
+            {"name": "__Secure-3PSID", "value": "psid", "domain": ".google.com"},
+            {"name": "SAPISID", "value": "sapisid", "domain": "notebooklm.google.com"},
+            {"name": "other", "value": "x", "domain": ".example.com"},
+        ]
+
+        cookies_dict, has_sid, has_psid, count = _summarize_google_cookies(cookies)
+
+        assert cookies_dict == {"SID": "sid", "__Secure-3PSID": "psid", "SAPISID": "sapisid"}
+        assert has_sid is True
+        assert has_psid is True
+        assert count == 3
+
+    def test_missing_session_cookies(self):
+        from noterang.auth import _summarize_google_cookies
+
+        cookies_dict, has_sid, has_psid, count = _summarize_google_cookies(
+            [{"name": "NID", "value": "n", "domain": ".google.com"}]
+        )
+
+        assert cookies_dict == {"NID": "n"}
+        assert (has_sid, has_psid, count) == (False, False, 1)
+
+
+# ---------------------------------------------------------------------------
+# Tests: _wait_for_notebooklm (async)
+# ---------------------------------------------------------------------------
+
+class TestWaitForNotebooklm:
+
+    @pytest.mark.asyncio
+    async def test_retries_app_password_until_field_appears(self):
+        from noterang.auth import _wait_for_notebooklm
+
+        password_input = MagicMock(fill=AsyncMock())
+        next_btn = MagicMock(click=AsyncMock())
+        page = MagicMock()
+        page.url = "https://accounts.google.com/v3/signin/identifier"
+
+        # 1회차: 이메일 단계라 비밀번호 필드 없음 → 2회차에 필드 등장
+        page.query_selector = AsyncMock(side_effect=[None, password_input, next_btn])
+
+        async def wait_for_url(predicate, timeout):
+            if not password_input.fill.await_count:
+                raise asyncio.TimeoutError
+            page.url = "https://notebooklm.google.com/"
+
+        page.wait_for_url = AsyncMock(side_effect=wait_for_url)
+
+        with patch("noterang.auth._APP_PASSWORD_RETRY_INTERVAL", 0.01), \
+             patch("noterang.auth.asyncio.sleep", new=AsyncMock()):
+            ok = await _wait_for_notebooklm(
+                page, time.time() + 5, "abcd efgh", asyncio.TimeoutError
+            )
+
+        assert ok is True
+        password_input.fill.assert_awaited_once_with("abcdefgh")
+        next_btn.click.assert_awaited_once()
+        assert page.wait_for_url.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_at_deadline(self):
+        from noterang.auth import _wait_for_notebooklm
+
+        page = MagicMock()
+        page.url = "https://accounts.google.com/v3/signin/identifier"
+        page.query_selector = AsyncMock(return_value=None)
+        page.wait_for_url = AsyncMock(side_effect=asyncio.TimeoutError)
+
+        with patch("noterang.auth._APP_PASSWORD_RETRY_INTERVAL", 0.01):
+            ok = await _wait_for_notebooklm(
+                page, time.time() + 0.05, "pw", asyncio.TimeoutError
+            )
+
+        assert ok is False
+        assert page.query_selector.await_count >= 1
+
+    @pytest.mark.asyncio
+    async def test_headless_returns_immediately_on_login_page(self):
+        from noterang.auth import _wait_for_notebooklm
+
+        page = MagicMock()
+        page.url = "https://notebooklm.google.com/"
+        page.query_selector = AsyncMock()
+
+        # 첫 대기 중에 로그인 페이지로 늦게 리다이렉트됨
+        async def wait_for_url(predicate, timeout):
+            page.url = "https://accounts.google.com/v3/signin/identifier"
+            raise asyncio.TimeoutError
+
+        page.wait_for_url = AsyncMock(side_effect=wait_for_url)
+
+        start = time.time()
+        ok = await _wait_for_notebooklm(
+            page, time.time() + 60, "", asyncio.TimeoutError, fail_on_login_page=True
+        )
+
+        assert ok is False
+        assert time.time() - start < 1
+        assert page.wait_for_url.await_count == 1
+        page.query_selector.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# Tests: sync_to_profile
+# ---------------------------------------------------------------------------
+
+class TestSyncToProfile:
+
+    def test_writes_profile_files_without_leftover_temp_files(self, noterang_config):
+        auth_data = {"cookies": {"SID": "sid"}, "session_id": "nb-1", "csrf_token": ""}
+
+        with patch("noterang.auth.get_config", return_value=noterang_config):
+            from noterang.auth import sync_to_profile
+            sync_to_profile(auth_data)
+
+        profile_dir = noterang_config.profile_dir
+        assert sorted(p.name for p in profile_dir.iterdir()) == [
+            ".auth.hash", "auth.json", "cookies.json", "metadata.json",
+        ]
+        cookies = json.loads((profile_dir / "cookies.json").read_text(encoding="utf-8"))
+        assert cookies[0]["name"] == "SID"
+        assert cookies[0]["domain"] == ".google.com"
+        assert json.loads((profile_dir / "auth.json").read_text(encoding="utf-8")) == auth_data
+
+    def test_skips_rewrite_when_auth_data_unchanged(self, noterang_config):
+        auth_data = {"cookies": {"SID": "sid"}, "session_id": "nb-1"}
+
+        with patch("noterang.auth.get_config", return_value=noterang_config):
+            from noterang.auth import sync_to_profile
+            sync_to_profile(auth_data)
+            metadata = noterang_config.profile_dir / "metadata.json"
+            metadata.write_text("stale", encoding="utf-8")
+
+            sync_to_profile(dict(auth_data))
+            assert metadata.read_text(encoding="utf-8") == "stale"
+
+            sync_to_profile({**auth_data, "session_id": "nb-2"})
+            assert json.loads(metadata.read_text(encoding="utf-8"))["session_id"] == "nb-2"
+
+
+# ---------------------------------------------------------------------------
+# Tests: run_nlm
+# ---------------------------------------------------------------------------
+
+class TestRunNlm:
+
+    def test_returns_text_output(self, noterang_config):
+        noterang_config.nlm_exe = sys.executable
+
+        with patch("noterang.auth.get_config", return_value=noterang_config):
+            from noterang.auth import run_nlm
+            success, stdout, stderr = run_nlm(
+                ["-c", "import sys; print('인포그래픽'); sys.exit(3)"]
+            )
+
+        assert success is False
+        assert stdout.strip() == "인포그래픽"
+        assert stderr == ""
+
+    def test_env_follows_later_os_environ_changes(self, noterang_config, monkeypatch):
+        noterang_config.nlm_exe = sys.executable
+        script = "import os; print(os.environ.get('NOTERANG_TEST_VAR'), os.environ['PYTHONIOENCODING'])"
+
+        with patch("noterang.auth.get_config", return_value=noterang_config):
+            from noterang.auth import run_nlm
+            run_nlm(["-c", script])
+            monkeypatch.setenv("NOTERANG_TEST_VAR", "after")
+            success, stdout, _ = run_nlm(["-c", script])
+
+        assert success is True
+        assert stdout.split() == ["after", "utf-8"]
+
+
+# ---------------------------------------------------------------------------
+# Tests: arun_nlm (async)
+# ---------------------------------------------------------------------------
+
+class TestArunNlm:
+
+    @pytest.mark.asyncio
+    async def test_returns_decoded_output(self, noterang_config):
+        noterang_config.nlm_exe = sys.executable
+
+        with patch("noterang.auth.get_config", return_value=noterang_config):
+            from noterang.auth import arun_nlm
+            success, stdout, stderr = await arun_nlm(["-c", "print('슬라이드 생성 started')"])
+
+        assert success is True
+        assert stdout.strip() == "슬라이드 생성 started"
+        assert stderr == ""
+
+    @pytest.mark.asyncio
+    async def test_kills_process_on_timeout(self, noterang_config):
+        noterang_config.nlm_exe = sys.executable
+
+        with patch("noterang.auth.get_config", return_value=noterang_config):
+            from noterang.auth import arun_nlm
+            success, stdout, stderr = await arun_nlm(
+                ["-c", "import time; time.sleep(10)"], timeout=0.2
+            )
+
+        assert success is False
+        assert "타임아웃" in stderr
+
+    @pytest.mark.asyncio
+    async def test_missing_executable(self, noterang_config, tmp_path):
+        noterang_config.nlm_exe = tmp_path / "missing-nlm"
+
+        with patch("noterang.auth.get_config", return_value=noterang_config):
+            from noterang.auth import arun_nlm
+            success, _, stderr = await arun_nlm(["studio", "status", "nb"])
+
+        assert success is False
+        assert "찾을 수 없습니다" in stderr
+
+
+# ---------------------------------------------------------------------------
+# Tests: ensure_auth (async)
+# ---------------------------------------------------------------------------
+
+class TestEnsureAuth:
+
+    @pytest.fixture(autouse=True)
+    def reset_auth_cache(self):
+        import noterang.auth as auth
+        auth._auth_verified_at = None
+        yield
+        auth._auth_verified_at = None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_check(self):
+        from noterang.auth import ensure_auth
+
+        with patch("noterang.auth.check_auth", return_value=True) as mock_check, \
+             patch("noterang.nlm_client.is_client_expired", return_value=False):
+            results = await asyncio.gather(*(ensure_auth() for _ in range(3)))
+            assert await ensure_auth() is True
+
+        assert results == [True, True, True]
+        mock_check.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_is_not_cached(self):
+        from noterang.auth import ensure_auth
+
+        with patch("noterang.auth.check_auth", return_value=False) as mock_check, \
+             patch("noterang.auth.auto_login", return_value=False), \
+             patch("noterang.auth.get_config"), \
+             patch("noterang.nlm_client.is_client_expired", return_value=False), \
+             patch("noterang.nlm_client.close_nlm_client"):
+            assert await ensure_auth() is False
+            assert await ensure_auth() is False
+
+        assert mock_check.call_count == 2
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for noterang/auto_login.py
+
+Tests:
+  - get_totp_code()
+  - _fresh_totp_code()
+  - _LOCKOUT_RE
+  - _chromium_args()
+  - _route_login_request() (async)
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("playwright")
+pyotp = pytest.importorskip("pyotp")
+
+SECRET = "JBSWY3DPEHPK3PXP"
+
+
+@pytest.fixture
+def auto_login(monkeypatch):
+    from noterang import auto_login as module
+
+    monkeypatch.setenv("GOOGLE_2FA_SECRET", SECRET)
+    module._totp.cache_clear()
+    yield module
+    module._totp.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# Tests: TOTP code generation
+# ---------------------------------------------------------------------------
+
+class TestTotpCode:
+
+    def test_code_for_given_time(self, auto_login):
+        assert auto_login.get_totp_code(for_time=1_000_000) == pyotp.TOTP(SECRET).at(1_000_000)
+
+    def test_uses_current_code_when_window_has_time_left(self, auto_login):
+        with patch.object(auto_login.time, "time", return_value=1_000_030.5):
+            code, wait = auto_login._fresh_totp_code()
+
+        assert wait == 0
+        assert code == pyotp.TOTP(SECRET).at(1_000_030)
+
+    def test_prefetches_next_code_before_expiry(self, auto_login):
+        # 1_000_048 → 현재 주기(1_000_020~) 만료까지 2초
+        with patch.object(auto_login.time, "time", return_value=1_000_048.0):
+            code, wait = auto_login._fresh_totp_code()
+
+        assert wait == 3
+        assert code == pyotp.TOTP(SECRET).at(1_000_051)
+        assert code != pyotp.TOTP(SECRET).at(1_000_048)
+
+
+# ---------------------------------------------------------------------------
+# Tests: lockout detection
+# ---------------------------------------------------------------------------
+
+class TestLockoutPattern:
+
+    def test_matches_indicators_case_insensitively(self, auto_login):
+        assert auto_login._LOCKOUT_RE.search("Google\nToo Many Failed Attempts. Try later")
+        assert auto_login._LOCKOUT_RE.search("본인 확인: 계정을 확인해야 합니다")
+
+    def test_ignores_normal_login_page(self, auto_login):
+        assert auto_login._LOCKOUT_RE.search("Sign in\nUse your Google Account") is None
+
+
+# ---------------------------------------------------------------------------
+# Tests: Chromium launch arguments
+# ---------------------------------------------------------------------------
+
+class TestChromiumArgs:
+
+    def test_headed_run_keeps_gpu_and_extensions(self, auto_login):
+        args = auto_login._chromium_args(headless=False)
+        assert "--disable-blink-features=AutomationControlled" in args
+        assert "--disable-gpu" not in args
+        assert "--disable-extensions" not in args
+
+    def test_headless_run_adds_background_service_flags(self, auto_login):
+        args = auto_login._chromium_args(headless=True)
+        assert "--disable-blink-features=AutomationControlled" in args
+        assert "--disable-gpu" in args
+        assert "--disable-background-networking" in args
+
+
+# ---------------------------------------------------------------------------
+# Tests: login request blocking (async)
+# ---------------------------------------------------------------------------
+
+def _route(resource_type, url):
+    route = MagicMock()
+    route.request.resource_type = resource_type
+    route.request.url = url
+    route.abort = AsyncMock()
+    route.continue_ = AsyncMock()
+    return route
+
+
+class TestRouteLoginRequest:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("resource_type,url", [
+        ("font", "https://fonts.gstatic.com/s/roboto.woff2"),
+        ("script", "https://www.googletagmanager.com/gtag/js"),
+    ])
+    async def test_blocks_fonts_and_trackers(self, auto_login, resource_type, url):
+        route = _route(resource_type, url)
+        await auto_login._route_login_request(route)
+        route.abort.assert_awaited_once()
+        route.continue_.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("resource_type", ["image", "script", "document", "xhr"])
+    async def test_allows_login_resources(self, auto_login, resource_type):
+        route = _route(resource_type, "https://accounts.google.com/v3/signin/identifier")
+        await auto_login._route_login_request(route)
+        route.continue_.assert_awaited_once()
+        route.abort.assert_not_awaited()
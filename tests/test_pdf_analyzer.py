@@ -39,7 +39,7 @@ def mock_fitz_doc_with_text():
     }
     page.get_text.side_effect = None
 
-    def get_text_dispatch(mode=None, flags=None):
+    def get_text_dispatch(mode=None, flags=None, textpage=None):
         if mode == "dict":
             return {"blocks": [block]}
         return "무릎 통증 원인\n슬개골 연골 연화증"
@@ -64,6 +64,8 @@ def mock_fitz_doc_no_text():
     page = MagicMock()
     page.get_text.return_value = ""
     page.get_text.side_effect = None
+    page.rect.width = 960.0
+    page.rect.height = 540.0
 
     pixmap = MagicMock()
     pixmap.tobytes.return_value = b"\x89PNG\r\nfake_png"
@@ -160,6 +162,36 @@ class TestExtractAllText:
         assert texts == ["", ""]
 
 
+# ---------------------------------------------------------------------------
+# Tests: text layer whitespace (real PyMuPDF)
+# ---------------------------------------------------------------------------
+
+class TestTextLayerWhitespace:
+
+    def test_tab_in_source_text_is_preserved(self, tmp_path):
+        import fitz
+
+        pdf_path = tmp_path / "tab.pdf"
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text((72, 72), "무릎 통증 원인", fontsize=28, fontname="korea")
+        page.insert_text((72, 144), "spaces\tand tab " * 20, fontsize=10)
+        doc.save(pdf_path)
+        doc.close()
+
+        from apps.web_publisher.pdf_analyzer import PDFAnalyzer
+        analyzer = PDFAnalyzer(pdf_path, vision_api_key="")
+        texts, _, textpages = analyzer._probe_text_layer()
+        del textpages
+
+        assert "spaces\tand tab" in texts[0]
+        assert "\ufffd" not in texts[0]
+
+        titles, full_texts = analyzer._extract_titles_and_texts()
+        assert titles == ["무릎 통증 원인"]
+        assert full_texts[0] == texts[0]
+
+
 # ---------------------------------------------------------------------------
 # Tests: _ocr_with_vision
 # ---------------------------------------------------------------------------
@@ -248,6 +280,67 @@ class TestOcrWithVision:
 
         assert result is None
 
+    def test_batches_pages_into_single_annotate_request(self, mock_fitz_doc_no_text, tmp_path):
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.write_bytes(b"%PDF")
+
+        session = MagicMock()
+        session.post.return_value.json.return_value = {
+            "responses": [
+                {"fullTextAnnotation": {"text": "첫 페이지"}},
+                {"fullTextAnnotation": {"text": "둘째 페이지"}},
+            ]
+        }
+
+        from apps.web_publisher.pdf_analyzer import PDFAnalyzer
+        with patch("fitz.open", return_value=mock_fitz_doc_no_text), \
+             patch.object(PDFAnalyzer, "_session", None), \
+             patch("requests.Session", return_value=session):
+            analyzer = PDFAnalyzer(pdf_path, vision_api_key="key")
+            result = analyzer._ocr_with_vision()
+            # 두 번째 분석기도 같은 세션을 재사용
+            assert PDFAnalyzer(pdf_path, vision_api_key="key")._get_session() is session
+
+        assert result == ["첫 페이지", "둘째 페이지"]
+        session.post.assert_called_once()
+        payload = session.post.call_args.kwargs["json"]
+        assert len(payload["requests"]) == 2
+
+    def test_caps_render_zoom_by_long_edge(self):
+        from apps.web_publisher.pdf_analyzer import _render_ocr_image
+
+        page = MagicMock()
+        page.rect.width = 3200.0
+        page.rect.height = 1800.0
+        page.get_pixmap.return_value.tobytes.return_value = b"\xff\xd8fake_jpeg"
+
+        assert _render_ocr_image(page) == "/9hmYWtlX2pwZWc="
+
+        matrix = page.get_pixmap.call_args.kwargs["matrix"]
+        assert matrix.a == pytest.approx(0.5)
+        assert matrix.d == pytest.approx(0.5)
+
+    def test_large_deck_renders_on_shared_pool(self, tmp_path):
+        import fitz
+
+        pdf_path = tmp_path / "deck.pdf"
+        doc = fitz.open()
+        for i in range(6):
+            doc.new_page().insert_text((72, 72), f"page {i}")
+        doc.save(pdf_path)
+        doc.close()
+
+        from apps.web_publisher.pdf_analyzer import PDFAnalyzer, _render_ocr_image
+        pool = MagicMock()
+        pool.map.side_effect = map
+        analyzer = PDFAnalyzer(pdf_path, vision_api_key="key")
+        with patch("apps.web_publisher.pdf_analyzer.get_render_pool", return_value=pool):
+            first = list(analyzer._iter_ocr_images())
+            second = list(analyzer._iter_ocr_images())
+
+        assert first == second == [_render_ocr_image(page) for page in analyzer.doc]
+        assert pool.map.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # Tests: extract_slide_titles
@@ -272,7 +365,7 @@ class TestExtractSlideTitles:
         pdf_path.write_bytes(b"%PDF")
 
         page = MagicMock()
-        page.get_text.side_effect = lambda mode=None, flags=None: (
+        page.get_text.side_effect = lambda mode=None, flags=None, textpage=None: (
             {"blocks": [{"type": 0, "lines": [{"spans": [{"text": "", "size": 20.0}]}]}]}
             if mode == "dict" else ""
         )
@@ -322,6 +415,18 @@ class TestGenerateThumbnail:
         page_mock = mock_fitz_doc_with_text[0]
         page_mock.get_pixmap.assert_called()
 
+    def test_render_thumbnail_opens_and_closes_by_path(self, mock_fitz_doc_with_text, tmp_path):
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.write_bytes(b"%PDF")
+
+        with patch("fitz.open", return_value=mock_fitz_doc_with_text) as mock_open:
+            from apps.web_publisher.pdf_analyzer import render_thumbnail
+            thumb = render_thumbnail(str(pdf_path))
+
+        mock_open.assert_called_once_with(str(pdf_path))
+        assert thumb == b"\x89PNG\r\nfake_thumb_bytes"
+        mock_fitz_doc_with_text.close.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # Tests: build_summary
@@ -346,7 +451,7 @@ class TestBuildSummary:
         pdf_path.write_bytes(b"%PDF")
 
         page = MagicMock()
-        page.get_text.side_effect = lambda mode=None, flags=None: (
+        page.get_text.side_effect = lambda mode=None, flags=None, textpage=None: (
             {"blocks": []} if mode == "dict" else ""
         )
 
@@ -424,6 +529,11 @@ class TestCleanSlideText:
     def test_empty_string_returns_empty(self):
         assert self.clean("") == ""
 
+    def test_applies_patterns_sequentially(self):
+        # 앞 패턴을 지운 결과에서 새로 생기는 잡음도 제거되어야 함
+        assert self.clean("·NotebookLM·NotebookLM·") == ""
+        assert self.clean(",. NotebookLM노트북LMaAaa") == "aAaa"
+
     def test_normal_text_unchanged(self):
         text = "무릎 통증 원인과 치료"
         result = self.clean(text)
@@ -453,7 +563,7 @@ class TestBuildContent:
         pdf_path.write_bytes(b"%PDF")
 
         page_empty = MagicMock()
-        page_empty.get_text.side_effect = lambda mode=None, flags=None: ""
+        page_empty.get_text.side_effect = lambda mode=None, flags=None, textpage=None: ""
 
         doc = MagicMock()
         doc.__len__ = MagicMock(return_value=2)
@@ -587,6 +697,28 @@ class TestAnalyze:
 
         assert isinstance(result["keywords"], list)
 
+    def test_fitz_lock_is_released_during_vision_ocr(self, mock_fitz_doc_no_text, tmp_path):
+        import threading
+
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.write_bytes(b"%PDF")
+        lock = threading.Lock()
+        held_during_request = []
+
+        def annotate(session, batch, first_page):
+            held_during_request.append(lock.locked())
+            return ["무릎 통증 원인과 치료 방법을 알기 쉽게 정리한 슬라이드 " * 3] * len(batch)
+
+        with patch("fitz.open", return_value=mock_fitz_doc_no_text):
+            from apps.web_publisher.pdf_analyzer import PDFAnalyzer
+            analyzer = PDFAnalyzer(pdf_path, vision_api_key="key", fitz_lock=lock)
+            with patch.object(PDFAnalyzer, "_annotate_batch", side_effect=annotate):
+                result = analyzer.analyze()
+
+        assert held_during_request == [False]
+        assert "무릎" in result["content"]
+        assert not lock.locked()
+
     def test_close_releases_doc(self, mock_fitz_doc_with_text, tmp_path):
         pdf_path = tmp_path / "test.pdf"
         pdf_path.write_bytes(b"%PDF")
@@ -597,3 +729,18 @@ class TestAnalyze:
             analyzer.close()
 
         mock_fitz_doc_with_text.close.assert_called_once()
+
+    def test_scanned_deck_skips_dict_extraction(self, mock_fitz_doc_no_text, tmp_path):
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.write_bytes(b"%PDF")
+
+        with patch("fitz.open", return_value=mock_fitz_doc_no_text):
+            from apps.web_publisher.pdf_analyzer import PDFAnalyzer
+            analyzer = PDFAnalyzer(pdf_path, vision_api_key="")
+            result = analyzer.analyze()
+
+        page = mock_fitz_doc_no_text[0]
+        modes = [c.args[0] if c.args else None for c in page.get_text.call_args_list]
+        assert "dict" not in modes
+        assert result["titles"] == []
+        assert result["content"] == ""
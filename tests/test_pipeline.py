@@ -177,6 +177,89 @@ class TestFirestoreClient:
         doc_data = call_args[0][0]
         assert "이하 생략" in doc_data["content"]
 
+    def test_build_article_truncates_content_by_utf8_bytes(self, mock_firebase_admin):
+        from apps.web_publisher.firestore_client import FirestoreClient, _CONTENT_MAX_BYTES
+        client = FirestoreClient(project_id="test-project")
+
+        # 1 ASCII byte offsets the 3-byte Hangul so the cut lands mid-character
+        long_content = "a" + "가" * 10000
+        doc_data = client.build_article(
+            title="바이트 제한",
+            pdf_url="/uploads/x.pdf",
+            thumb_url=None,
+            analysis={"titles": [], "summary": "", "content": long_content},
+            tags=[],
+        )
+
+        body = doc_data["content"].split("[전체 내용]\n", 1)[1]
+        kept = body.replace("\n\n... (이하 생략)", "")
+        assert len(kept.encode("utf-8")) <= _CONTENT_MAX_BYTES
+        assert "�" not in kept
+
+    def test_register_articles_bulk_commits_single_batch(self, mock_firestore_db):
+        refs = [MagicMock(id=f"bulk-{i}") for i in range(3)]
+        mock_firestore_db.collection.return_value.document.side_effect = refs
+
+        from apps.web_publisher.firestore_client import FirestoreClient
+        client = FirestoreClient(project_id="test-project")
+        client._db = mock_firestore_db
+
+        doc_ids = client.register_articles_bulk([{"title": f"t{i}"} for i in range(3)])
+
+        assert doc_ids == ["bulk-0", "bulk-1", "bulk-2"]
+        batch = mock_firestore_db.batch.return_value
+        assert batch.set.call_count == 3
+        batch.commit.assert_called_once()
+        mock_firestore_db.collection.return_value.add.assert_not_called()
+
+    def test_register_articles_bulk_returns_none_ids_on_commit_error(self, mock_firestore_db):
+        mock_firestore_db.batch.return_value.commit.side_effect = Exception("Firestore down")
+
+        from apps.web_publisher.firestore_client import FirestoreClient
+        client = FirestoreClient(project_id="test-project")
+        client._db = mock_firestore_db
+
+        doc_ids = client.register_articles_bulk([{"title": "a"}, {"title": "b"}])
+
+        assert doc_ids == [None, None]
+
+    def test_register_articles_bulk_uses_bulk_writer_above_batch_limit(self, mock_firestore_db):
+        refs = [MagicMock(id=f"bulk-{i}") for i in range(501)]
+        mock_firestore_db.collection.return_value.document.side_effect = refs
+        bulk_writer = mock_firestore_db.bulk_writer.return_value
+
+        def fail_second_write(ref, doc_data):
+            if ref is refs[1]:
+                on_error = bulk_writer.on_write_error.call_args.args[0]
+                failure = MagicMock(attempts=3, code=10, message="aborted")
+                failure.operation.reference = ref
+                assert on_error(failure) is False
+
+        bulk_writer.create.side_effect = fail_second_write
+
+        from apps.web_publisher.firestore_client import FirestoreClient
+        client = FirestoreClient(project_id="test-project")
+        client._db = mock_firestore_db
+
+        doc_ids = client.register_articles_bulk([{"title": f"t{i}"} for i in range(501)])
+
+        assert bulk_writer.create.call_count == 501
+        bulk_writer.close.assert_called_once()
+        mock_firestore_db.batch.assert_not_called()
+        assert doc_ids[:3] == ["bulk-0", None, "bulk-2"]
+        assert doc_ids[-1] == "bulk-500"
+
+    def test_get_db_shares_client_across_instances(self, mock_firebase_admin):
+        from apps.web_publisher import firestore_client
+        from apps.web_publisher.firestore_client import FirestoreClient
+
+        with patch.dict(firestore_client._DB_CACHE, clear=True):
+            first = FirestoreClient(project_id="shared-project")._get_db()
+            second = FirestoreClient(project_id="shared-project")._get_db()
+
+        assert first is not None
+        assert second is first
+
     def test_lazy_db_initialization(self, tmp_path):
         """_get_db() is not called until register_article is invoked."""
         from apps.web_publisher.firestore_client import FirestoreClient
@@ -270,6 +353,47 @@ class TestFileManager:
 
         assert url1 != url2  # uuid suffix makes them different
 
+    def test_falls_back_to_copy_when_hard_link_fails(self, tmp_path, sample_pdf_path):
+        uploads_dir = tmp_path / "uploads"
+
+        from apps.web_publisher.file_manager import FileManager
+        mgr = FileManager(uploads_dir)
+        with patch("apps.web_publisher.file_manager.os.link",
+                   side_effect=OSError("cross-device link")):
+            pdf_url, _ = mgr.copy_pdf_and_thumbnail(sample_pdf_path, "테스트", None)
+
+        dest_path = uploads_dir / pdf_url.split("/uploads/")[1]
+        assert dest_path.read_bytes() == sample_pdf_path.read_bytes()
+
+    def test_waits_for_pdf_copy_when_thumbnail_write_fails(self, tmp_path, sample_pdf_path):
+        import threading
+        uploads_dir = tmp_path / "uploads"
+        copy_done = threading.Event()
+
+        def slow_copy(src, dest):
+            copy_done.wait(0.2)
+            copy_done.set()
+            raise OSError("copy failed")
+
+        from apps.web_publisher.file_manager import FileManager
+        mgr = FileManager(uploads_dir)
+        real_open = open
+
+        def failing_open(path, mode="r", *args, **kwargs):
+            if str(path).endswith("_thumb.png"):
+                raise PermissionError("thumbnail denied")
+            return real_open(path, mode, *args, **kwargs)
+
+        with patch("apps.web_publisher.file_manager._link_or_copy", side_effect=slow_copy), \
+             patch("builtins.open", side_effect=failing_open), \
+             patch("apps.web_publisher.file_manager.logger") as mock_logger:
+            with pytest.raises(PermissionError):
+                mgr.copy_pdf_and_thumbnail(sample_pdf_path, "테스트", b"\x89PNG")
+
+        # 예외가 전파되기 전에 PDF 복사가 끝났고, 그 오류도 로그에 남음
+        assert copy_done.is_set()
+        mock_logger.error.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # WebPublishPipeline.__init__ and helper method tests
@@ -405,6 +529,23 @@ class TestGetFocusPrompt:
             prompt = pipeline.get_focus_prompt()
         assert "한의학" in prompt  # mentioned as exclusion rule
 
+    def test_slide_prompts_loaded_once_across_pipelines(self):
+        from apps.web_publisher.pipeline import _slide_prompts
+
+        first = self._make_pipeline(title="무릎 통증")
+        second = self._make_pipeline(title="어깨 통증")
+        _slide_prompts.cache_clear()
+        try:
+            with patch("apps.web_publisher.pipeline.SlidePrompts") as mock_prompts:
+                mock_prompts.return_value.get_prompt.return_value = "[디자인 프롬프트]"
+                first.get_focus_prompt()
+                prompt = second.get_focus_prompt()
+        finally:
+            _slide_prompts.cache_clear()
+
+        mock_prompts.assert_called_once_with()
+        assert prompt.startswith("[디자인 프롬프트]")
+
 
 # ---------------------------------------------------------------------------
 # WebPublishPipeline.generate_tags